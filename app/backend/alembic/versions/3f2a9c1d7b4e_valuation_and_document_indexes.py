@@ -0,0 +1,59 @@
+"""valuation run idempotency key and index cleanup
+
+Revision ID: 3f2a9c1d7b4e
+Revises:
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f2a9c1d7b4e'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+# Tables whose primary keys also carried an index=True duplicate (ix_<table>_id)
+_PK_INDEXED_TABLES = (
+    'tenants', 'users', 'engagements', 'documents', 'jobs',
+    'validation_issues', 'valuation_runs', 'market_data_providers', 'audit_logs',
+)
+
+
+def upgrade() -> None:
+    # Client Idempotency-Key for valuation run requests
+    op.add_column('valuation_runs', sa.Column('idempotency_key', sa.String(length=64), nullable=True))
+    op.create_unique_constraint(
+        'uq_engagement_idempotency_key', 'valuation_runs', ['engagement_id', 'idempotency_key']
+    )
+    
+    # uq_engagement_run_number already leads with engagement_id
+    op.drop_index('ix_valuations_engagement', table_name='valuation_runs')
+    
+    # Latest-completed-run reads; the Enum column stores member names
+    op.create_index(
+        'ix_valuations_engagement_completed', 'valuation_runs', ['engagement_id', 'created_at'],
+        postgresql_where=sa.text("status = 'COMPLETED'"),
+        sqlite_where=sa.text("status = 'COMPLETED'"),
+    )
+    
+    # Serves both engagement_id lookups and the newest-first document listing
+    op.drop_index('ix_documents_engagement', table_name='documents')
+    op.create_index('ix_documents_engagement_uploaded', 'documents', ['engagement_id', 'uploaded_at'])
+    
+    # The primary key constraint already indexes id
+    for table in _PK_INDEXED_TABLES:
+        op.drop_index(f'ix_{table}_id', table_name=table)
+
+
+def downgrade() -> None:
+    for table in _PK_INDEXED_TABLES:
+        op.create_index(f'ix_{table}_id', table, ['id'])
+    op.drop_index('ix_documents_engagement_uploaded', table_name='documents')
+    op.create_index('ix_documents_engagement', 'documents', ['engagement_id'])
+    op.drop_index('ix_valuations_engagement_completed', table_name='valuation_runs')
+    op.create_index('ix_valuations_engagement', 'valuation_runs', ['engagement_id'])
+    op.drop_constraint('uq_engagement_idempotency_key', 'valuation_runs', type_='unique')
+    op.drop_column('valuation_runs', 'idempotency_key')
@@ -17,8 +17,10 @@ router = APIRouter()
 async def register(request: RegisterRequest, db: Session = Depends(get_db)):
     """Register a new user and tenant."""
     # Check if user already exists
-    existing_user = db.query(User).filter(User.email == request.email).first()
-    if existing_user:
+    email_taken = db.query(
+        db.query(User).filter(User.email == request.email).exists()
+    ).scalar()
+    if email_taken:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered"
@@ -28,8 +30,10 @@ async def register(request: RegisterRequest, db: Session = Depends(get_db)):
     tenant_slug = re.sub(r'[^a-z0-9]+', '-', request.tenant_name.lower()).strip('-')
     
     # Check if tenant slug exists
-    existing_tenant = db.query(Tenant).filter(Tenant.slug == tenant_slug).first()
-    if existing_tenant:
+    slug_taken = db.query(
+        db.query(Tenant).filter(Tenant.slug == tenant_slug).exists()
+    ).scalar()
+    if slug_taken:
         tenant_slug = f"{tenant_slug}-{datetime.utcnow().strftime('%Y%m%d%H%M%S')}"
     
     # Create tenant
@@ -29,7 +29,7 @@ async def get_upload_url(
 ):
     """Get a signed URL for uploading a document."""
     # Verify engagement exists and user has access
-    engagement = db.query(Engagement).filter(
+    engagement = db.query(Engagement.id).filter(
         Engagement.id == engagement_id,
         Engagement.tenant_id == current_user.tenant_id
     ).first()
@@ -90,7 +90,7 @@ async def list_documents(
 ):
     """List all documents for an engagement."""
     # Verify engagement access
-    engagement = db.query(Engagement).filter(
+    engagement = db.query(Engagement.id).filter(
         Engagement.id == engagement_id,
         Engagement.tenant_id == current_user.tenant_id
     ).first()
@@ -115,7 +115,7 @@ async def start_ingestion(
 ):
     """Start document ingestion workflow."""
     # Verify engagement access
-    engagement = db.query(Engagement).filter(
+    engagement = db.query(Engagement.id).filter(
         Engagement.id == engagement_id,
         Engagement.tenant_id == current_user.tenant_id
     ).first()
@@ -183,6 +183,7 @@ async def get_document(
 @router.delete("/documents/{document_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_document(
     document_id: int,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -195,14 +196,20 @@ async def delete_document(
     if not document:
         raise HTTPException(status_code=404, detail="Document not found")
     
-    # Delete from GCS
-    try:
-        bucket = storage_client.bucket(settings.uploads_bucket)
-        blob = bucket.blob(document.gcs_path)
-        blob.delete()
-    except Exception:
-        pass  # Continue even if GCS deletion fails
+    gcs_path = document.gcs_path
     
     db.delete(document)
     db.commit()
+    
+    # Delete from GCS after the response is sent
+    background_tasks.add_task(_delete_upload, gcs_path)
+
+
+def _delete_upload(gcs_path: str) -> None:
+    """Remove an uploaded file from GCS, ignoring failures."""
+    try:
+        bucket = storage_client.bucket(settings.uploads_bucket)
+        bucket.blob(gcs_path).delete()
+    except Exception:
+        pass  # The document row is already gone; an orphaned blob is harmless
 
@@ -1,7 +1,7 @@
 """Engagements API endpoints."""
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, true
 
 from database import get_db
 from models import User, Engagement, Document, Job, ValidationIssue, ValuationRun
@@ -129,7 +129,7 @@ async def get_engagement_status(
     db: Session = Depends(get_db)
 ):
     """Get comprehensive engagement status."""
-    engagement = db.query(Engagement).filter(
+    engagement = db.query(Engagement.id).filter(
         Engagement.id == engagement_id,
         Engagement.tenant_id == current_user.tenant_id
     ).first()
@@ -143,35 +143,53 @@ async def get_engagement_status(
         Job.status.in_(["pending", "running"])
     ).all()
     
-    # Get document counts
-    documents_count = db.query(func.count(Document.id)).filter(
+    # Get document, validation issue and valuation counts in one round trip
+    document_counts = db.query(
+        func.count(Document.id).label("total"),
+        func.count(Document.id).filter(Document.is_parsed == True).label("parsed")
+    ).filter(
         Document.engagement_id == engagement_id
-    ).scalar()
-    
-    parsed_documents = db.query(func.count(Document.id)).filter(
-        Document.engagement_id == engagement_id,
-        Document.is_parsed == True
-    ).scalar()
+    ).subquery()
     
-    # Get validation issue counts
-    validation_issues = db.query(func.count(ValidationIssue.id)).filter(
+    issue_counts = db.query(
+        func.count(ValidationIssue.id).label("total"),
+        func.count(ValidationIssue.id).filter(ValidationIssue.is_resolved == False).label("unresolved")
+    ).filter(
         ValidationIssue.engagement_id == engagement_id
-    ).scalar()
+    ).subquery()
     
-    unresolved_issues = db.query(func.count(ValidationIssue.id)).filter(
-        ValidationIssue.engagement_id == engagement_id,
-        ValidationIssue.is_resolved == False
-    ).scalar()
-    
-    # Get valuations count
-    valuations_count = db.query(func.count(ValuationRun.id)).filter(
+    valuation_counts = db.query(
+        func.count(ValuationRun.id).label("total")
+    ).filter(
         ValuationRun.engagement_id == engagement_id
-    ).scalar()
-    
-    # Get latest valuation
-    latest_valuation = db.query(ValuationRun).filter(
+    ).subquery()
+    
+    (
+        documents_count, parsed_documents,
+        validation_issues, unresolved_issues,
+        valuations_count
+    ) = db.query(
+        document_counts.c.total, document_counts.c.parsed,
+        issue_counts.c.total, issue_counts.c.unresolved,
+        valuation_counts.c.total
+    ).select_from(document_counts).join(
+        issue_counts, true()
+    ).join(
+        valuation_counts, true()
+    ).one()
+    
+    # Get latest valuation (summary columns only; skips loading the results_detail JSON).
+    # Run numbers are assigned in creation order, so the highest one is the latest run and
+    # the unique (engagement_id, run_number) index returns it without a sort.
+    latest_valuation = db.query(
+        ValuationRun.id,
+        ValuationRun.run_number,
+        ValuationRun.concluded_value,
+        ValuationRun.status,
+        ValuationRun.created_at
+    ).filter(
         ValuationRun.engagement_id == engagement_id
-    ).order_by(ValuationRun.created_at.desc()).first()
+    ).order_by(ValuationRun.run_number.desc()).first()
     
     return {
         "engagement_id": engagement_id,
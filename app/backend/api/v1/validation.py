@@ -1,8 +1,9 @@
 """Validation API endpoints."""
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
-from sqlalchemy import func
 from datetime import datetime
+from itertools import groupby
+from operator import attrgetter
 
 from database import get_db
 from models import User, Engagement, ValidationIssue, ValidationSeverity
@@ -23,7 +24,7 @@ async def list_validation_issues(
 ):
     """List all validation issues for an engagement."""
     # Verify engagement access
-    engagement = db.query(Engagement).filter(
+    engagement = db.query(Engagement.id).filter(
         Engagement.id == engagement_id,
         Engagement.tenant_id == current_user.tenant_id
     ).first()
@@ -39,21 +40,14 @@ async def list_validation_issues(
         ValidationIssue.created_at.desc()
     ).all()
     
-    # Count by severity
-    severity_counts = db.query(
-        ValidationIssue.severity,
-        func.count(ValidationIssue.id)
-    ).filter(
-        ValidationIssue.engagement_id == engagement_id
-    ).group_by(ValidationIssue.severity).all()
-    
-    counts = {severity: count for severity, count in severity_counts}
+    # Count by severity; issues are ordered by severity, so each group is contiguous
+    counts = {
+        severity: sum(1 for _ in group)
+        for severity, group in groupby(issues, key=attrgetter('severity'))
+    }
     
-    # Count unresolved
-    unresolved = db.query(func.count(ValidationIssue.id)).filter(
-        ValidationIssue.engagement_id == engagement_id,
-        ValidationIssue.is_resolved == False
-    ).scalar()
+    # Count unresolved (NULL is_resolved didn't match the old SQL filter either)
+    unresolved = sum(1 for issue in issues if issue.is_resolved is False)
     
     return {
         "issues": issues,
@@ -74,7 +68,7 @@ async def accept_suggestion(
 ):
     """Accept an AI suggestion."""
     # Verify engagement access
-    engagement = db.query(Engagement).filter(
+    engagement = db.query(Engagement.id).filter(
         Engagement.id == engagement_id,
         Engagement.tenant_id == current_user.tenant_id
     ).first()
@@ -117,7 +111,7 @@ async def override_suggestion(
 ):
     """Override AI suggestion with manual fix."""
     # Verify engagement access
-    engagement = db.query(Engagement).filter(
+    engagement = db.query(Engagement.id).filter(
         Engagement.id == engagement_id,
         Engagement.tenant_id == current_user.tenant_id
     ).first()
@@ -1,10 +1,12 @@
 """Valuation API endpoints."""
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Header, HTTPException, status, BackgroundTasks, Request, Response
+from sqlalchemy.orm import Session, defer
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
 from google.cloud import tasks_v2
 from google.protobuf import timestamp_pb2
 import json
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 from database import get_db
 from models import User, Engagement, ValuationRun, JobStatus
@@ -17,47 +19,103 @@ router = APIRouter()
 # Initialize Cloud Tasks client
 tasks_client = tasks_v2.CloudTasksClient()
 
+# Runs older than this are never reused for a repeated request, so a run left
+# pending by a crashed worker doesn't block retries
+_IN_FLIGHT_WINDOW = timedelta(minutes=10)
+
+
+def _naive_utc(value: datetime) -> datetime:
+    """Convert an aware datetime to the naive UTC form stored in DateTime columns."""
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
 
 @router.post("/engagements/{engagement_id}/valuation/run", response_model=ValuationRunResponse, status_code=status.HTTP_202_ACCEPTED)
 async def run_valuation(
     engagement_id: int,
     request: ValuationRunRequest,
+    idempotency_key: str | None = Header(None, max_length=64),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Execute valuation for an engagement."""
-    # Verify engagement access
-    engagement = db.query(Engagement).filter(
+    # Verify engagement access and get the latest run number in one round trip
+    engagement = db.query(
+        Engagement.id,
+        func.max(ValuationRun.run_number).label("max_run_number")
+    ).outerjoin(
+        ValuationRun, ValuationRun.engagement_id == Engagement.id
+    ).filter(
         Engagement.id == engagement_id,
         Engagement.tenant_id == current_user.tenant_id
-    ).first()
+    ).group_by(Engagement.id).first()
     
     if not engagement:
         raise HTTPException(status_code=404, detail="Engagement not found")
     
-    # Get next run number
-    max_run = db.query(ValuationRun).filter(
-        ValuationRun.engagement_id == engagement_id
-    ).order_by(ValuationRun.run_number.desc()).first()
+    valuation_date = _naive_utc(request.valuation_date)
+    methods_config = request.methods.model_dump() if hasattr(request.methods, 'model_dump') else request.methods
+    assumptions = {
+        "wacc": request.wacc_inputs.model_dump(),
+        "method_weights": request.method_weights
+    }
     
-    run_number = (max_run.run_number + 1) if max_run else 1
+    if idempotency_key:
+        # A retried request returns the run its first attempt created
+        existing = db.query(ValuationRun).options(defer(ValuationRun.results_detail)).filter(
+            ValuationRun.engagement_id == engagement_id,
+            ValuationRun.idempotency_key == idempotency_key
+        ).first()
+        if existing:
+            return existing
+    else:
+        # Without a key, best-effort reuse of an identical run queued moments ago
+        # (e.g. a double-submitted form); only the key is safe against concurrent requests
+        in_flight = db.query(ValuationRun).options(defer(ValuationRun.results_detail)).filter(
+            ValuationRun.engagement_id == engagement_id,
+            ValuationRun.status.in_([JobStatus.PENDING, JobStatus.RUNNING]),
+            ValuationRun.created_at >= datetime.utcnow() - _IN_FLIGHT_WINDOW
+        ).all()
+        
+        for run in in_flight:
+            if (
+                run.valuation_date == valuation_date
+                and run.methods_config == methods_config
+                and run.assumptions == assumptions
+            ):
+                return run
+    
+    # Get next run number
+    run_number = (engagement.max_run_number or 0) + 1
     
     # Create valuation run
     valuation_run = ValuationRun(
         engagement_id=engagement_id,
         run_number=run_number,
         run_name=request.run_name or f"Run {run_number}",
-        valuation_date=request.valuation_date,
-        methods_config=request.methods.model_dump() if hasattr(request.methods, 'model_dump') else request.methods,
-        assumptions={
-            "wacc": request.wacc_inputs.model_dump(),
-            "method_weights": request.method_weights
-        },
+        valuation_date=valuation_date,
+        methods_config=methods_config,
+        assumptions=assumptions,
         status=JobStatus.PENDING,
-        created_by=current_user.id
+        created_by=current_user.id,
+        idempotency_key=idempotency_key
     )
     db.add(valuation_run)
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        if not idempotency_key:
+            raise
+        # A concurrent request with the same key inserted first; it owns the task
+        existing = db.query(ValuationRun).filter(
+            ValuationRun.engagement_id == engagement_id,
+            ValuationRun.idempotency_key == idempotency_key
+        ).first()
+        if existing is None:
+            raise
+        return existing
     db.refresh(valuation_run)
     
     # Queue valuation task
@@ -97,36 +155,48 @@ async def run_valuation(
 @router.get("/engagements/{engagement_id}/valuation/result", response_model=ValuationResultDetail)
 async def get_valuation_result(
     engagement_id: int,
+    http_request: Request,
+    response: Response,
     run_id: int | None = None,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get valuation results."""
-    # Verify engagement access
-    engagement = db.query(Engagement).filter(
-        Engagement.id == engagement_id,
+    # Get valuation run, verifying engagement access in the same query
+    runs = db.query(ValuationRun).join(Engagement).filter(
+        ValuationRun.engagement_id == engagement_id,
         Engagement.tenant_id == current_user.tenant_id
-    ).first()
-    
-    if not engagement:
-        raise HTTPException(status_code=404, detail="Engagement not found")
+    )
     
-    # Get valuation run
     if run_id:
-        valuation_run = db.query(ValuationRun).filter(
-            ValuationRun.id == run_id,
-            ValuationRun.engagement_id == engagement_id
-        ).first()
+        valuation_run = runs.filter(ValuationRun.id == run_id).first()
     else:
         # Get latest completed run
-        valuation_run = db.query(ValuationRun).filter(
-            ValuationRun.engagement_id == engagement_id,
+        valuation_run = runs.filter(
             ValuationRun.status == JobStatus.COMPLETED
         ).order_by(ValuationRun.created_at.desc()).first()
     
     if not valuation_run:
+        # Only the miss path needs the engagement on its own, to pick the right 404
+        engagement = db.query(Engagement.id).filter(
+            Engagement.id == engagement_id,
+            Engagement.tenant_id == current_user.tenant_id
+        ).first()
+        
+        if not engagement:
+            raise HTTPException(status_code=404, detail="Engagement not found")
+        
         raise HTTPException(status_code=404, detail="Valuation run not found")
     
+    # Completed runs are never rewritten, so the run id identifies the payload and
+    # clients can revalidate with If-None-Match instead of re-downloading it
+    if valuation_run.status == JobStatus.COMPLETED:
+        etag = f'"valuation-run-{valuation_run.id}"'
+        cache_headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+        if http_request.headers.get("if-none-match") == etag:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers)
+        response.headers.update(cache_headers)
+    
     # Extract detailed results
     results_detail = valuation_run.results_detail or {}
     
@@ -147,7 +217,7 @@ async def list_valuation_runs(
 ):
     """List all valuation runs for an engagement."""
     # Verify engagement access
-    engagement = db.query(Engagement).filter(
+    engagement = db.query(Engagement.id).filter(
         Engagement.id == engagement_id,
         Engagement.tenant_id == current_user.tenant_id
     ).first()
@@ -155,7 +225,8 @@ async def list_valuation_runs(
     if not engagement:
         raise HTTPException(status_code=404, detail="Engagement not found")
     
-    runs = db.query(ValuationRun).filter(
+    # The list response has no results_detail, so leave the JSON out of the SELECT
+    runs = db.query(ValuationRun).options(defer(ValuationRun.results_detail)).filter(
         ValuationRun.engagement_id == engagement_id
     ).order_by(ValuationRun.created_at.desc()).all()
     
@@ -172,7 +243,7 @@ async def download_workbook(
     from google.cloud import storage
     
     # Verify engagement access
-    engagement = db.query(Engagement).filter(
+    engagement = db.query(Engagement.id).filter(
         Engagement.id == engagement_id,
         Engagement.tenant_id == current_user.tenant_id
     ).first()
@@ -211,7 +282,7 @@ async def download_summary(
     from google.cloud import storage
     
     # Verify engagement access
-    engagement = db.query(Engagement).filter(
+    engagement = db.query(Engagement.id).filter(
         Engagement.id == engagement_id,
         Engagement.tenant_id == current_user.tenant_id
     ).first()
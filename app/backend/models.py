@@ -50,7 +50,7 @@ class Tenant(Base):
     """Multi-tenant organization."""
     __tablename__ = "tenants"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     name = Column(String(255), nullable=False)
     slug = Column(String(100), unique=True, nullable=False, index=True)
     is_active = Column(Boolean, default=True)
@@ -66,7 +66,7 @@ class User(Base):
     """Application users."""
     __tablename__ = "users"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     tenant_id = Column(Integer, ForeignKey("tenants.id"), nullable=False)
     email = Column(String(255), unique=True, nullable=False, index=True)
     hashed_password = Column(String(255), nullable=False)
@@ -85,7 +85,7 @@ class Engagement(Base):
     """Valuation engagement/project."""
     __tablename__ = "engagements"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     tenant_id = Column(Integer, ForeignKey("tenants.id"), nullable=False)
     name = Column(String(255), nullable=False)
     client_name = Column(String(255))
@@ -114,7 +114,7 @@ class Document(Base):
     """Uploaded financial documents."""
     __tablename__ = "documents"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     engagement_id = Column(Integer, ForeignKey("engagements.id"), nullable=False)
     document_type = Column(Enum(DocumentType), nullable=False)
     original_filename = Column(String(255), nullable=False)
@@ -132,8 +132,9 @@ class Document(Base):
     # Relationships
     engagement = relationship("Engagement", back_populates="documents")
     
+    # Serves both engagement_id lookups and the newest-first document listing
     __table_args__ = (
-        Index('ix_documents_engagement', 'engagement_id'),
+        Index('ix_documents_engagement_uploaded', 'engagement_id', 'uploaded_at'),
     )
 
 
@@ -141,7 +142,7 @@ class Job(Base):
     """Background processing jobs."""
     __tablename__ = "jobs"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     engagement_id = Column(Integer, ForeignKey("engagements.id"), nullable=False)
     job_type = Column(String(50), nullable=False)  # ingestion, normalization, validation, valuation
     status = Column(Enum(JobStatus), default=JobStatus.PENDING)
@@ -168,7 +169,7 @@ class ValidationIssue(Base):
     """Validation issues and AI suggestions."""
     __tablename__ = "validation_issues"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     engagement_id = Column(Integer, ForeignKey("engagements.id"), nullable=False)
     severity = Column(Enum(ValidationSeverity), nullable=False)
     rule_code = Column(String(50))  # e.g., BS_IMBALANCE, NEGATIVE_INVENTORY
@@ -204,7 +205,7 @@ class ValuationRun(Base):
     """Valuation execution and results."""
     __tablename__ = "valuation_runs"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     engagement_id = Column(Integer, ForeignKey("engagements.id"), nullable=False)
     run_number = Column(Integer, default=1)
     run_name = Column(String(255))
@@ -228,13 +229,21 @@ class ValuationRun(Base):
     created_by = Column(Integer, ForeignKey("users.id"))
     created_at = Column(DateTime, default=datetime.utcnow)
     completed_at = Column(DateTime)
+    idempotency_key = Column(String(64))  # Client Idempotency-Key for the run request
     
     # Relationships
     engagement = relationship("Engagement", back_populates="valuations")
     
+    # The unique (engagement_id, run_number) index also serves engagement_id lookups.
+    # Latest-completed-run reads use a partial index that skips pending/failed runs.
     __table_args__ = (
-        Index('ix_valuations_engagement', 'engagement_id'),
         UniqueConstraint('engagement_id', 'run_number', name='uq_engagement_run_number'),
+        UniqueConstraint('engagement_id', 'idempotency_key', name='uq_engagement_idempotency_key'),
+        Index(
+            'ix_valuations_engagement_completed', 'engagement_id', 'created_at',
+            postgresql_where=(status == JobStatus.COMPLETED),
+            sqlite_where=(status == JobStatus.COMPLETED),
+        ),
     )
 
 
@@ -242,7 +251,7 @@ class MarketDataProvider(Base):
     """Configuration for market data providers."""
     __tablename__ = "market_data_providers"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     tenant_id = Column(Integer, ForeignKey("tenants.id"), nullable=False)
     provider_name = Column(String(100), nullable=False)  # pitchbook, capiq, dealstats, etc.
     is_active = Column(Boolean, default=True)
@@ -265,7 +274,7 @@ class AuditLog(Base):
     """Audit trail for all significant actions."""
     __tablename__ = "audit_logs"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     tenant_id = Column(Integer, ForeignKey("tenants.id"), nullable=False)
     user_id = Column(Integer, ForeignKey("users.id"))
     engagement_id = Column(Integer, ForeignKey("engagements.id"))
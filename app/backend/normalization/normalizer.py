@@ -1,15 +1,21 @@
 """Financial data normalization service."""
 import logging
+from types import MappingProxyType
 from typing import Dict, Any, List
 import pandas as pd
 from decimal import Decimal
 
 logger = logging.getLogger(__name__)
 
+# Shared read-only default for missing sub-dicts, so lookups don't allocate
+_EMPTY = MappingProxyType({})
+
 
 class FinancialNormalizer:
     """Normalize financial data to canonical format with reconciliation."""
     
+    __slots__ = ('canonical_coa', 'coa_by_code')
+    
     def __init__(self, canonical_coa: pd.DataFrame):
         """
         Initialize normalizer with canonical COA.
@@ -50,9 +56,11 @@ class FinancialNormalizer:
                     }
                 
                 # Add values for each period
+                item_values = item.get('values', _EMPTY)
+                code_values = grouped[code]['values']
                 for period in periods:
-                    value = item.get('values', {}).get(period, 0)
-                    grouped[code]['values'][period] += Decimal(str(value))
+                    value = item_values.get(period, 0)
+                    code_values[period] += Decimal(str(value))
         
         # Build normalized structure
         normalized = {
@@ -84,9 +92,11 @@ class FinancialNormalizer:
                         'values': {period: Decimal('0') for period in periods}
                     }
                 
+                item_values = item.get('values', _EMPTY)
+                code_values = grouped[code]['values']
                 for period in periods:
-                    value = item.get('values', {}).get(period, 0)
-                    grouped[code]['values'][period] += Decimal(str(value))
+                    value = item_values.get(period, 0)
+                    code_values[period] += Decimal(str(value))
         
         normalized = {
             'periods': periods,
@@ -117,9 +127,11 @@ class FinancialNormalizer:
                         'values': {period: Decimal('0') for period in periods}
                     }
                 
+                item_values = item.get('values', _EMPTY)
+                code_values = grouped[code]['values']
                 for period in periods:
-                    value = item.get('values', {}).get(period, 0)
-                    grouped[code]['values'][period] += Decimal(str(value))
+                    value = item_values.get(period, 0)
+                    code_values[period] += Decimal(str(value))
         
         normalized = {
             'periods': periods,
@@ -254,26 +266,16 @@ class FinancialNormalizer:
         """Perform reconciliation checks on balance sheet."""
         issues = []
         
+        # Classify line items once rather than rescanning them for every period
+        assets = [item['values'] for code, item in grouped.items() if code.startswith('ASSET_')]
+        liabilities = [item['values'] for code, item in grouped.items() if code.startswith('LIAB_')]
+        equity = [item['values'] for code, item in grouped.items() if code.startswith('EQUITY_')]
+        
         # Check if Assets = Liabilities + Equity
         for period in periods:
-            total_assets = Decimal('0')
-            total_liab = Decimal('0')
-            total_equity = Decimal('0')
-            
-            # Sum assets
-            for code, item in grouped.items():
-                if code.startswith('ASSET_'):
-                    total_assets += item['values'][period]
-            
-            # Sum liabilities
-            for code, item in grouped.items():
-                if code.startswith('LIAB_'):
-                    total_liab += item['values'][period]
-            
-            # Sum equity
-            for code, item in grouped.items():
-                if code.startswith('EQUITY_'):
-                    total_equity += item['values'][period]
+            total_assets = sum((values[period] for values in assets), Decimal('0'))
+            total_liab = sum((values[period] for values in liabilities), Decimal('0'))
+            total_equity = sum((values[period] for values in equity), Decimal('0'))
             
             difference = total_assets - (total_liab + total_equity)
             
@@ -1,6 +1,10 @@
 """Excel parsing service."""
 import logging
-from typing import Dict, Any, List
+import os
+import re
+from itertools import chain, islice
+from typing import Dict, Any, List, Tuple
+import numpy as np
 import pandas as pd
 from openpyxl import load_workbook
 from google.cloud import storage
@@ -9,6 +13,33 @@ from config import settings
 
 logger = logging.getLogger(__name__)
 
+# Statement type -> indicator keywords, checked in order
+_STATEMENT_KEYWORDS = (
+    ('income_statement', ('revenue', 'sales', 'cogs', 'gross profit', 'net income', 'operating income')),
+    ('balance_sheet', ('assets', 'liabilities', 'equity', 'retained earnings', 'accounts receivable')),
+    ('cash_flow', ('cash flow', 'operating activities', 'investing activities', 'financing activities')),
+)
+
+# One compiled alternation per statement type, built once at import
+_STATEMENT_PATTERNS = tuple(
+    (statement_type, re.compile('|'.join(map(re.escape, keywords))))
+    for statement_type, keywords in _STATEMENT_KEYWORDS
+)
+
+# Workbooks at least this large are parsed with openpyxl's streaming reader
+_STREAMING_MIN_BYTES = 20 * 1024 * 1024
+
+# Cell strings read_excel treats as missing by default
+_NA_STRINGS = [
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND',
+    '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null'
+]
+
+
+def _is_text(value: Any) -> bool:
+    """Whether a cell holds text (as opposed to a number, date or blank)."""
+    return isinstance(value, str)
+
 
 class ExcelParser:
     """Parse Excel files and extract financial data."""
@@ -26,7 +57,7 @@ class ExcelParser:
         Returns:
             Parsed Excel data with sheets and tables
         """
-        logger.info(f"Parsing Excel file: {gcs_path}")
+        logger.info("Parsing Excel file: %s", gcs_path)
         
         try:
             # Download file from GCS
@@ -37,61 +68,149 @@ class ExcelParser:
             temp_file = f"/tmp/{blob.name.split('/')[-1]}"
             blob.download_to_filename(temp_file)
             
-            # Load workbook
-            wb = load_workbook(temp_file, data_only=True)
-            
-            # Extract data from each sheet
-            sheets = {}
-            for sheet_name in wb.sheetnames:
-                sheet_data = self._parse_sheet(temp_file, sheet_name)
-                if sheet_data:
-                    sheets[sheet_name] = sheet_data
+            # Large .xlsx files are streamed row by row to keep memory flat
+            if os.path.getsize(temp_file) >= _STREAMING_MIN_BYTES:
+                sheets, total_sheets = self._parse_workbook_streaming(temp_file)
+            else:
+                # Open the workbook once and parse each sheet from it
+                with pd.ExcelFile(temp_file, engine='openpyxl') as excel_file:
+                    sheet_names = excel_file.sheet_names
+                    sheets = {}
+                    for sheet_name in sheet_names:
+                        sheet_data = self._parse_sheet(excel_file, sheet_name)
+                        if sheet_data:
+                            sheets[sheet_name] = sheet_data
+                    total_sheets = len(sheet_names)
             
             return {
                 "sheets": list(sheets.keys()),
                 "data": sheets,
-                "total_sheets": len(wb.sheetnames)
+                "total_sheets": total_sheets
             }
             
         except Exception as e:
-            logger.error(f"Error parsing Excel file {gcs_path}: {str(e)}")
+            logger.error("Error parsing Excel file %s: %s", gcs_path, e)
             raise
     
-    def _parse_sheet(self, file_path: str, sheet_name: str) -> Dict[str, Any]:
+    def _parse_sheet(self, excel_file: pd.ExcelFile, sheet_name: str) -> Dict[str, Any]:
         """Parse a single Excel sheet."""
         try:
-            # Read with pandas for easier data manipulation
-            df = pd.read_excel(file_path, sheet_name=sheet_name, header=None)
+            # Read once without a header or NA conversion; both are applied in memory below
+            raw = excel_file.parse(sheet_name, header=None, na_filter=False)
+            df = raw.replace(_NA_STRINGS, np.nan)
             
             # Find header row (first non-empty row with mostly text)
             header_row = self._find_header_row(df)
             
             if header_row is not None:
-                # Re-read with proper header
-                df = pd.read_excel(file_path, sheet_name=sheet_name, header=header_row)
-                
-                # Clean column names
-                df.columns = [str(col).strip() for col in df.columns]
-                
-                # Drop empty rows and columns
-                df = df.dropna(how='all').dropna(axis=1, how='all')
-                
-                # Detect numeric columns (likely amounts)
-                numeric_cols = df.select_dtypes(include=['float64', 'int64']).columns.tolist()
+                # Promote the header row instead of re-reading the sheet; like a
+                # headed read, only blank header cells are missing, not 'NA' labels
+                header = self._header_labels(raw.iloc[header_row].replace('', np.nan))
+                df = df.iloc[header_row + 1:].reset_index(drop=True)
+                df.columns = header
                 
-                return {
-                    "header_row": header_row,
-                    "columns": df.columns.tolist(),
-                    "numeric_columns": numeric_cols,
-                    "rows": len(df),
-                    "data": df.to_dict(orient='records')
-                }
+                # Restore the numeric dtypes a headed read would have inferred
+                return self._sheet_result(df.infer_objects(), header_row)
             
             return None
             
         except Exception as e:
-            logger.warning(f"Error parsing sheet {sheet_name}: {str(e)}")
+            logger.warning("Error parsing sheet %s: %s", sheet_name, e)
+            return None
+    
+    def _parse_workbook_streaming(self, file_path: str) -> Tuple[Dict[str, Any], int]:
+        """
+        Parse every sheet of a large workbook without loading whole sheets up front.
+        
+        Args:
+            file_path: Local path to an .xlsx/.xlsm workbook
+            
+        Returns:
+            Tuple of (parsed sheets by name, total number of sheets)
+        """
+        wb = load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            sheets = {}
+            for ws in wb.worksheets:
+                try:
+                    sheet_data = self._parse_streamed_sheet(ws)
+                except Exception as e:
+                    logger.warning("Error parsing sheet %s: %s", ws.title, e)
+                    continue
+                if sheet_data:
+                    sheets[ws.title] = sheet_data
+            
+            return sheets, len(wb.worksheets)
+        finally:
+            wb.close()
+    
+    def _parse_streamed_sheet(self, ws, max_search_rows: int = 20) -> Dict[str, Any]:
+        """Parse a read-only worksheet, reading rows lazily."""
+        rows = ws.iter_rows(values_only=True)
+        
+        # Only the first rows are needed to find the header
+        head = list(islice(rows, max_search_rows))
+        raw_head = pd.DataFrame(head)
+        head_df = raw_head.replace(_NA_STRINGS, np.nan)
+        header_row = self._find_header_row(head_df, max_search_rows)
+        
+        if header_row is None:
+            # Rejected sheets are never read past the search window
             return None
+        
+        # The sheet dimension covers columns that only appear further down
+        width = max(ws.max_column or 0, head_df.shape[1])
+        header = self._header_labels(raw_head.iloc[header_row].reindex(range(width)))
+        body = chain(head[header_row + 1:], rows)
+        df = pd.DataFrame.from_records(
+            (row[:width] for row in body), columns=header, coerce_float=True
+        )
+        
+        # Match read_excel: default NA markers become NaN, then re-infer dtypes
+        df = df.replace(_NA_STRINGS, np.nan).fillna(np.nan).infer_objects()
+        
+        return self._sheet_result(df, header_row)
+    
+    def _sheet_result(self, df: pd.DataFrame, header_row: int) -> Dict[str, Any]:
+        """Clean a headed DataFrame and build the parsed sheet dict."""
+        # Drop empty rows and columns
+        df = df.dropna(how='all').dropna(axis=1, how='all')
+        
+        # Detect numeric columns (likely amounts)
+        numeric_cols = df.select_dtypes(include=['float64', 'int64']).columns.tolist()
+        
+        return {
+            "header_row": header_row,
+            "columns": df.columns.tolist(),
+            "numeric_columns": numeric_cols,
+            "rows": len(df),
+            "data": df.to_dict(orient='records')
+        }
+    
+    def _header_labels(self, row: pd.Series) -> List[str]:
+        """
+        Build cleaned column names from a header row.
+        
+        Mirrors pandas' own header handling: blank cells become
+        "Unnamed: <n>" and repeated names get a ".<k>" suffix.
+        """
+        labels = []
+        seen = {}
+        for position, value in enumerate(row):
+            if pd.isna(value):
+                label = f"Unnamed: {position}"
+            elif isinstance(value, float) and value.is_integer():
+                # A year header above numeric data comes back as float (2023.0);
+                # render it as the worksheet cell did ("2023")
+                label = str(int(value))
+            else:
+                label = str(value)
+            count = seen.get(label, 0)
+            seen[label] = count + 1
+            if count:
+                label = f"{label}.{count}"
+            labels.append(label.strip())
+        return labels
     
     def _find_header_row(self, df: pd.DataFrame, max_search_rows: int = 20) -> int:
         """
@@ -104,20 +223,31 @@ class ExcelParser:
         Returns:
             Row index of header, or None if not found
         """
-        for i in range(min(max_search_rows, len(df))):
-            row = df.iloc[i]
-            
-            # Count non-empty cells
-            non_empty = row.notna().sum()
-            
-            if non_empty >= 2:  # At least 2 column headers
-                # Check if mostly text (not numbers)
-                text_count = sum(isinstance(val, str) for val in row if pd.notna(val))
-                
-                if text_count >= non_empty * 0.5:  # At least 50% text
-                    return i
+        head = df.iloc[:max_search_rows]
         
-        return None
+        # Only non-numeric, non-datetime columns can hold text cells
+        text_cols = [
+            col for col in head.columns
+            if not pd.api.types.is_numeric_dtype(head[col])
+            and not pd.api.types.is_datetime64_any_dtype(head[col])
+        ]
+        if not text_cols:
+            return None
+        
+        # Count non-empty and text cells for every candidate row at once
+        non_empty = head.notna().sum(axis=1).to_numpy()
+        # Blank cells are dropped first, so only filled cells are type-checked
+        text_count = (
+            head[text_cols].apply(lambda col: col.dropna().map(_is_text))
+            .sum(axis=1)
+            .reindex(head.index, fill_value=0)
+            .to_numpy(dtype=np.int64)
+        )
+        
+        # At least 2 column headers, at least 50% text
+        matches = np.flatnonzero((non_empty >= 2) & (text_count >= non_empty * 0.5))
+        
+        return int(matches[0]) if matches.size else None
     
     def detect_financial_statement_type(self, sheet_data: Dict[str, Any]) -> str:
         """
@@ -140,17 +270,10 @@ class ExcelParser:
         first_col = df.iloc[:, 0].astype(str).str.lower()
         all_text = ' '.join(first_col)
         
-        # Income statement indicators
-        if any(keyword in all_text for keyword in ['revenue', 'sales', 'cogs', 'gross profit', 'net income', 'operating income']):
-            return "income_statement"
-        
-        # Balance sheet indicators
-        if any(keyword in all_text for keyword in ['assets', 'liabilities', 'equity', 'retained earnings', 'accounts receivable']):
-            return "balance_sheet"
-        
-        # Cash flow indicators
-        if any(keyword in all_text for keyword in ['cash flow', 'operating activities', 'investing activities', 'financing activities']):
-            return "cash_flow"
+        # First statement type whose keywords appear wins
+        for statement_type, pattern in _STATEMENT_PATTERNS:
+            if pattern.search(all_text):
+                return statement_type
         
         return "other"
 
@@ -1,14 +1,38 @@
 """Rule-based validation engine."""
 import logging
+from types import MappingProxyType
 from typing import Dict, Any, List
-from decimal import Decimal
 
 logger = logging.getLogger(__name__)
 
+# Issue templates; per-period fields are filled in only once a rule fires
+_NEG_REV_TPL = {'rule_code': 'NEG_REVENUE', 'severity': 'error', 'affected_items': ['REV_001']}
+_MARGIN_HIGH_TPL = {'rule_code': 'EXTREME_MARGIN_HIGH', 'severity': 'warning', 'affected_items': ['REV_001', 'GP_001']}
+_MARGIN_NEG_TPL = {'rule_code': 'NEGATIVE_MARGIN', 'severity': 'warning', 'affected_items': ['REV_001', 'GP_001']}
+_BS_IMBALANCE_TPL = {'rule_code': 'BS_IMBALANCE', 'severity': 'error', 'affected_items': ['ASSET_*', 'LIAB_*', 'EQUITY_*']}
+_NEG_EQUITY_TPL = {'rule_code': 'NEGATIVE_EQUITY', 'severity': 'warning', 'affected_items': ['EQUITY_*']}
+_NEG_INVENTORY_TPL = {'rule_code': 'NEGATIVE_INVENTORY', 'severity': 'error', 'affected_items': ['ASSET_CURR_004']}
+_CF_RECON_TPL = {'rule_code': 'CF_RECON_FAIL', 'severity': 'error', 'affected_items': ['CF_*']}
+_MISSING_ITEM_TPL = {'rule_code': 'MISSING_CRITICAL_ITEM', 'severity': 'error'}
+
+# Shared read-only default for missing sub-dicts, so lookups don't allocate
+_EMPTY = MappingProxyType({})
+
+
+def _issue(template: Dict[str, Any], **fields: Any) -> Dict[str, Any]:
+    """Build an issue dict from a shared template."""
+    issue = template.copy()
+    if 'affected_items' in issue:
+        issue['affected_items'] = list(issue['affected_items'])
+    issue.update(fields)
+    return issue
+
 
 class ValidationRules:
     """Rule-based financial statement validation."""
     
+    __slots__ = ()
+    
     def validate_income_statement(self, normalized_data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Validate income statement data."""
         issues = []
@@ -23,7 +47,7 @@ class ValidationRules:
         """Validate balance sheet data."""
         issues = []
         
-        issues.extend(self._check_balance_sheet_equation(normalized_data))
+        issues.extend(self._check_reconciliations(normalized_data, cash_flow=False))
         issues.extend(self._check_negative_equity(normalized_data))
         issues.extend(self._check_negative_inventory(normalized_data))
         issues.extend(self._check_missing_items(normalized_data, 'balance_sheet'))
@@ -34,7 +58,7 @@ class ValidationRules:
         """Validate cash flow statement."""
         issues = []
         
-        issues.extend(self._check_cash_reconciliation(normalized_data))
+        issues.extend(self._check_reconciliations(normalized_data, balance_sheet=False))
         issues.extend(self._check_missing_items(normalized_data, 'cash_flow'))
         
         return issues
@@ -48,15 +72,14 @@ class ValidationRules:
         
         if revenue_item:
             for period, value in revenue_item['values'].items():
-                if Decimal(str(value)) < 0:
-                    issues.append({
-                        'rule_code': 'NEG_REVENUE',
-                        'severity': 'error',
-                        'description': f'Negative revenue detected in {period}',
-                        'affected_items': ['REV_001'],
-                        'period': period,
-                        'value': float(value)
-                    })
+                amount = float(value)
+                if amount < 0:
+                    issues.append(_issue(
+                        _NEG_REV_TPL,
+                        description=f'Negative revenue detected in {period}',
+                        period=period,
+                        value=amount
+                    ))
         
         return issues
     
@@ -71,49 +94,79 @@ class ValidationRules:
             gross_profit = line_items['GP_001']['values']
             
             for period in revenue.keys():
-                rev_val = Decimal(str(revenue[period]))
-                gp_val = Decimal(str(gross_profit[period]))
+                rev_val = float(revenue[period])
+                gp_val = float(gross_profit[period])
                 
                 if rev_val > 0:
                     margin = (gp_val / rev_val) * 100
                     
                     if margin > 95:
-                        issues.append({
-                            'rule_code': 'EXTREME_MARGIN_HIGH',
-                            'severity': 'warning',
-                            'description': f'Unusually high gross margin ({margin:.1f}%) in {period}',
-                            'affected_items': ['REV_001', 'GP_001'],
-                            'period': period,
-                            'margin': float(margin)
-                        })
+                        issues.append(_issue(
+                            _MARGIN_HIGH_TPL,
+                            description=f'Unusually high gross margin ({margin:.1f}%) in {period}',
+                            period=period,
+                            margin=margin
+                        ))
                     elif margin < 0:
-                        issues.append({
-                            'rule_code': 'NEGATIVE_MARGIN',
-                            'severity': 'warning',
-                            'description': f'Negative gross margin ({margin:.1f}%) in {period}',
-                            'affected_items': ['REV_001', 'GP_001'],
-                            'period': period,
-                            'margin': float(margin)
-                        })
+                        issues.append(_issue(
+                            _MARGIN_NEG_TPL,
+                            description=f'Negative gross margin ({margin:.1f}%) in {period}',
+                            period=period,
+                            margin=margin
+                        ))
         
         return issues
     
-    def _check_balance_sheet_equation(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Check if Assets = Liabilities + Equity."""
+    def _check_reconciliations(
+        self,
+        data: Dict[str, Any],
+        balance_sheet: bool = True,
+        cash_flow: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Turn reconciliation failures into issues in a single pass.
+        
+        Args:
+            data: Normalized statement data
+            balance_sheet: Report Assets = Liabilities + Equity failures
+            cash_flow: Report cash reconciliation failures
+            
+        Returns:
+            Issues for the requested reconciliation rules
+        """
+        reconciliation = data.get('reconciliation')
+        if not reconciliation:
+            return []
+        
+        # Group entries by rule once, so each rule's check runs over its own entries
+        by_rule = {}
+        for recon in reconciliation:
+            by_rule.setdefault(recon.get('rule', ''), []).append(recon)
+        
         issues = []
         
-        reconciliation = data.get('reconciliation', [])
-        
-        for recon in reconciliation:
-            if recon['rule'] == 'balance_sheet_equation':
-                issues.append({
-                    'rule_code': 'BS_IMBALANCE',
-                    'severity': 'error',
-                    'description': recon['description'],
-                    'affected_items': ['ASSET_*', 'LIAB_*', 'EQUITY_*'],
-                    'period': recon['period'],
-                    'difference': recon['difference']
-                })
+        # The balance sheet rule is matched exactly; cash rules by case-insensitive substring
+        for rule, recons in by_rule.items():
+            if rule == 'balance_sheet_equation':
+                if not balance_sheet:
+                    continue
+                for recon in recons:
+                    issues.append(_issue(
+                        _BS_IMBALANCE_TPL,
+                        description=recon['description'],
+                        period=recon['period'],
+                        difference=recon['difference']
+                    ))
+            elif 'cash' in rule.lower():
+                # Would check if CFO + CFI + CFF = Change in Cash
+                if not cash_flow:
+                    continue
+                for recon in recons:
+                    issues.append(_issue(
+                        _CF_RECON_TPL,
+                        description=recon['description'],
+                        period=recon.get('period')
+                    ))
         
         return issues
     
@@ -121,19 +174,18 @@ class ValidationRules:
         """Check for negative equity."""
         issues = []
         
-        calculations = data.get('calculations', {})
-        total_equity = calculations.get('total_equity', {})
+        calculations = data.get('calculations', _EMPTY)
+        total_equity = calculations.get('total_equity', _EMPTY)
         
         for period, value in total_equity.items():
-            if Decimal(str(value)) < 0:
-                issues.append({
-                    'rule_code': 'NEGATIVE_EQUITY',
-                    'severity': 'warning',
-                    'description': f'Negative equity in {period} (may indicate financial distress)',
-                    'affected_items': ['EQUITY_*'],
-                    'period': period,
-                    'value': float(value)
-                })
+            amount = float(value)
+            if amount < 0:
+                issues.append(_issue(
+                    _NEG_EQUITY_TPL,
+                    description=f'Negative equity in {period} (may indicate financial distress)',
+                    period=period,
+                    value=amount
+                ))
         
         return issues
     
@@ -146,34 +198,14 @@ class ValidationRules:
         
         if inventory_item:
             for period, value in inventory_item['values'].items():
-                if Decimal(str(value)) < 0:
-                    issues.append({
-                        'rule_code': 'NEGATIVE_INVENTORY',
-                        'severity': 'error',
-                        'description': f'Negative inventory in {period}',
-                        'affected_items': ['ASSET_CURR_004'],
-                        'period': period,
-                        'value': float(value)
-                    })
-        
-        return issues
-    
-    def _check_cash_reconciliation(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Check cash flow reconciliation."""
-        issues = []
-        
-        # Would check if CFO + CFI + CFF = Change in Cash
-        reconciliation = data.get('reconciliation', [])
-        
-        for recon in reconciliation:
-            if 'cash' in recon.get('rule', '').lower():
-                issues.append({
-                    'rule_code': 'CF_RECON_FAIL',
-                    'severity': 'error',
-                    'description': recon['description'],
-                    'affected_items': ['CF_*'],
-                    'period': recon.get('period'),
-                })
+                amount = float(value)
+                if amount < 0:
+                    issues.append(_issue(
+                        _NEG_INVENTORY_TPL,
+                        description=f'Negative inventory in {period}',
+                        period=period,
+                        value=amount
+                    ))
         
         return issues
     
@@ -192,12 +224,11 @@ class ValidationRules:
         
         for required_code in required_items.get(statement_type, []):
             if required_code not in present_codes:
-                issues.append({
-                    'rule_code': 'MISSING_CRITICAL_ITEM',
-                    'severity': 'error',
-                    'description': f'Critical line item {required_code} is missing',
-                    'affected_items': [required_code],
-                })
+                issues.append(_issue(
+                    _MISSING_ITEM_TPL,
+                    description=f'Critical line item {required_code} is missing',
+                    affected_items=[required_code]
+                ))
         
         return issues
 
@@ -0,0 +1,36 @@
+"""Compiled kernels for DCF sensitivity sweeps."""
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - numba is an optional accelerator
+    prange = range
+    
+    def njit(*args, **kwargs):
+        """Fallback that leaves the kernel as plain NumPy code."""
+        def decorator(func):
+            return func
+        return decorator
+
+
+@njit('float64[:, :](float64[:], float64[:], float64[:], boolean, float64)', cache=True, parallel=True)
+def sensitivity_grid(fcf, waccs, growths, mid_year, net_cash):
+    """Gordon growth equity value for every (WACC, growth) pair; NaN where WACC <= growth."""
+    out = np.empty((waccs.size, growths.size))
+    final_fcf = fcf[fcf.size - 1]
+    for i in prange(waccs.size):
+        w = waccs[i]
+        base = 1.0 / (1.0 + w)
+        df = base ** 0.5 if mid_year else 1.0
+        pv_forecast = 0.0
+        for t in range(fcf.size):
+            df *= base
+            pv_forecast += fcf[t] * df
+        for j in range(growths.size):
+            g = growths[j]
+            if w > g:
+                # The terminal value shares the final period's discount factor
+                out[i, j] = pv_forecast + final_fcf * (1.0 + g) / (w - g) * df + net_cash
+            else:
+                out[i, j] = np.nan
+    return out
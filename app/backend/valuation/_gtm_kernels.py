@@ -0,0 +1,27 @@
+"""Compiled kernels for GTM multiple reduction."""
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is an optional accelerator
+    def njit(*args, **kwargs):
+        """Fallback that leaves the kernel as plain NumPy code."""
+        def decorator(func):
+            return func
+        return decorator
+
+
+# No fastmath here: the NaN checks must survive compilation
+@njit('float64[:](float64[:], float64[:])', cache=True)
+def valid_multiples(ev, denom):
+    """Divide EV by the denominator where both are usable."""
+    valid = np.isfinite(ev) & (ev != 0.0) & np.isfinite(denom) & (denom > 0.0)
+    return ev[valid] / denom[valid]
+
+
+@njit('UniTuple(float64, 4)(float64[:], float64)', cache=True, fastmath=True)
+def summarize_multiples(multiples, subject):
+    """Return (median, mean, indicated median value, indicated mean value)."""
+    median = np.median(multiples)
+    mean = np.mean(multiples)
+    return median, mean, subject * median, subject * mean
@@ -0,0 +1,22 @@
+"""Compiled kernels for WACC sensitivity grids."""
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is an optional accelerator
+    def njit(*args, **kwargs):
+        """Fallback that leaves the kernel as plain NumPy code."""
+        def decorator(func):
+            return func
+        return decorator
+
+
+@njit(
+    'float64[:, :](float64, float64[:], float64[:], float64, float64, float64, float64, float64, float64)',
+    cache=True,
+    fastmath=True
+)
+def wacc_grid(rf, erp, beta, size_prem, co_specific, kd, tax, wd, we):
+    """WACC over a beta x ERP grid; rows follow beta, columns follow ERP."""
+    cost_of_equity = rf + np.outer(beta, erp) + size_prem + co_specific
+    return we * cost_of_equity + wd * kd * (1.0 - tax)
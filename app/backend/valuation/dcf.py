@@ -1,15 +1,113 @@
 """DCF (Discounted Cash Flow) valuation."""
+import bisect
+import functools
 import logging
-from typing import Dict, Any, List
-from decimal import Decimal
+from collections import namedtuple
+from typing import Dict, Any, List, Optional, Tuple
 import numpy as np
 
+from ._dcf_kernels import sensitivity_grid
+
 logger = logging.getLogger(__name__)
 
 
+_DCFCore = namedtuple('_DCFCore', [
+    'enterprise_value', 'equity_value', 'pv_forecast_fcf', 'pv_terminal_value',
+    'terminal_value', 'discount_factors', 'pv_fcf', 'cash', 'debt'
+])
+
+
+@functools.lru_cache(maxsize=4096)
+def _dcf_core(
+    forecast_fcf: Tuple[float, ...],
+    wacc: float,
+    terminal_growth_rate: Optional[float],
+    exit_multiple: Optional[float],
+    terminal_ebitda: Optional[float],
+    cash: float,
+    debt: float,
+    mid_year_convention: bool
+) -> _DCFCore:
+    """
+    Compute DCF values from hashable primitive inputs.
+    
+    Results are memoized so repeated calls with identical inputs (sensitivity
+    grids, what-if UIs) skip the PV and terminal value computation.
+    """
+    fcf = np.asarray(forecast_fcf, dtype=np.float64)
+    
+    # Discount factors as a running product of the one-period factor
+    base = 1.0 / (1.0 + wacc)
+    discount_factors = np.cumprod(np.full(len(fcf), base))
+    if mid_year_convention:
+        discount_factors *= base ** 0.5
+    
+    # Present value of forecast cash flows
+    pv_fcf = fcf * discount_factors
+    total_pv_fcf = float(pv_fcf.sum())
+    
+    # Calculate terminal value
+    if exit_multiple is not None:
+        # Exit Multiple Method
+        terminal_value = float(terminal_ebitda) * float(exit_multiple)
+    else:
+        # Gordon Growth Model
+        # TV = FCF_final * (1 + g) / (WACC - g)
+        final_fcf = float(fcf[-1])
+        g = float(terminal_growth_rate)
+        w = float(wacc)
+        
+        if w <= g:
+            logger.warning("WACC (%s) <= terminal growth (%s), adjusting growth rate", w, g)
+            g = w * 0.8  # Set g to 80% of WACC
+        
+        terminal_value = (final_fcf * (1.0 + g)) / (w - g)
+    
+    # Present value of terminal value (discounted from the final forecast period)
+    pv_terminal_value = terminal_value * float(discount_factors[-1])
+    
+    # Enterprise Value = PV of forecast FCF + PV of Terminal Value
+    enterprise_value = total_pv_fcf + pv_terminal_value
+    
+    # Equity Value = Enterprise Value + Cash - Debt
+    cash = float(cash)
+    debt = float(debt)
+    equity_value = enterprise_value + cash - debt
+    
+    return _DCFCore(
+        enterprise_value=enterprise_value,
+        equity_value=equity_value,
+        pv_forecast_fcf=total_pv_fcf,
+        pv_terminal_value=pv_terminal_value,
+        terminal_value=terminal_value,
+        discount_factors=tuple(discount_factors.tolist()),
+        pv_fcf=tuple(pv_fcf.tolist()),
+        cash=cash,
+        debt=debt
+    )
+
+
+def _pv_forecast(forecast_fcf: Tuple[float, ...], wacc: float, mid_year_convention: bool) -> Tuple[float, float]:
+    """
+    Present value of the forecast FCF and the final period's discount factor.
+    
+    Accumulates in a single pass with a running discount factor, so callers that
+    only need the totals skip building the per-period arrays.
+    """
+    base = 1.0 / (1.0 + wacc)
+    discount_factor = base ** 0.5 if mid_year_convention else 1.0
+    pv = 0.0
+    for fcf in forecast_fcf:
+        discount_factor *= base
+        pv += fcf * discount_factor
+    return pv, discount_factor
+
+
 class DCFValuation:
     """Perform DCF valuation."""
     
+    __slots__ = ()
+    
     def calculate_dcf(
         self,
         historical_financials: Dict[str, Any],
@@ -43,61 +141,33 @@ class DCFValuation:
             logger.error("No forecasted free cash flows provided")
             return {'error': 'No forecast data'}
         
-        # Discount periods (adjust for mid-year convention)
-        if mid_year_convention:
-            periods = [i + 0.5 for i in range(1, forecast_years + 1)]
-        else:
-            periods = list(range(1, forecast_years + 1))
-        
-        # Discount factors
-        discount_factors = [(1 + wacc) ** -p for p in periods]
-        
-        # Present value of forecast cash flows
-        pv_fcf = [Decimal(str(fcf)) * Decimal(str(df)) for fcf, df in zip(forecast_fcf, discount_factors)]
-        total_pv_fcf = sum(pv_fcf)
-        
-        # Calculate terminal value
         if exit_multiple is not None:
-            # Exit Multiple Method
             terminal_ebitda = forecast.get('terminal_ebitda', forecast_fcf[-1] * 1.5)  # Rough proxy
-            terminal_value = Decimal(str(terminal_ebitda)) * Decimal(str(exit_multiple))
             tv_method = 'exit_multiple'
         elif terminal_growth_rate is not None:
-            # Gordon Growth Model
-            # TV = FCF_final * (1 + g) / (WACC - g)
-            final_fcf = Decimal(str(forecast_fcf[-1]))
-            g = Decimal(str(terminal_growth_rate))
-            w = Decimal(str(wacc))
-            
-            if w <= g:
-                logger.warning(f"WACC ({w}) <= terminal growth ({g}), adjusting growth rate")
-                g = w * Decimal('0.8')  # Set g to 80% of WACC
-            
-            terminal_value = (final_fcf * (Decimal('1') + g)) / (w - g)
+            terminal_ebitda = None
             tv_method = 'gordon_growth'
         else:
             logger.error("Must provide either terminal_growth_rate or exit_multiple")
             return {'error': 'Missing terminal value method'}
         
-        # Present value of terminal value
-        tv_period = periods[-1]
-        tv_discount_factor = Decimal(str((1 + wacc) ** -tv_period))
-        pv_terminal_value = terminal_value * tv_discount_factor
-        
-        # Enterprise Value = PV of forecast FCF + PV of Terminal Value
-        enterprise_value = total_pv_fcf + pv_terminal_value
-        
-        # Equity Value = Enterprise Value + Cash - Debt
-        cash = Decimal(str(historical_financials.get('cash', 0)))
-        debt = Decimal(str(historical_financials.get('total_debt', 0)))
-        equity_value = enterprise_value + cash - debt
+        core = _dcf_core(
+            tuple(forecast_fcf),
+            wacc,
+            terminal_growth_rate,
+            exit_multiple,
+            terminal_ebitda,
+            historical_financials.get('cash', 0),
+            historical_financials.get('total_debt', 0),
+            mid_year_convention
+        )
         
         return {
-            'enterprise_value': float(enterprise_value),
-            'equity_value': float(equity_value),
-            'pv_forecast_fcf': float(total_pv_fcf),
-            'pv_terminal_value': float(pv_terminal_value),
-            'terminal_value': float(terminal_value),
+            'enterprise_value': core.enterprise_value,
+            'equity_value': core.equity_value,
+            'pv_forecast_fcf': core.pv_forecast_fcf,
+            'pv_terminal_value': core.pv_terminal_value,
+            'terminal_value': core.terminal_value,
             'terminal_value_method': tv_method,
             'wacc': wacc,
             'terminal_growth_rate': terminal_growth_rate if terminal_growth_rate else None,
@@ -105,11 +175,11 @@ class DCFValuation:
             'forecast_years': forecast_years,
             'mid_year_convention': mid_year_convention,
             'detail': {
-                'forecast_fcf': [float(f) for f in forecast_fcf],
-                'discount_factors': discount_factors,
-                'pv_fcf': [float(p) for p in pv_fcf],
-                'cash': float(cash),
-                'debt': float(debt)
+                'forecast_fcf': np.asarray(forecast_fcf, dtype=np.float64).tolist(),
+                'discount_factors': list(core.discount_factors),
+                'pv_fcf': list(core.pv_fcf),
+                'cash': core.cash,
+                'debt': core.debt
             }
         }
     
@@ -165,23 +235,25 @@ class DCFValuation:
         """
         logger.info("Performing DCF sensitivity analysis")
         
-        sensitivity_table = []
+        # Inputs that don't vary across the grid are read once
+        fcf = np.asarray(base_fcf, dtype=np.float64)
+        cash = float(historical_financials.get('cash', 0))
+        debt = float(historical_financials.get('total_debt', 0))
         
-        for wacc in wacc_range:
-            row = []
-            for growth in growth_range:
-                if wacc <= growth:
-                    row.append(None)  # Invalid combination
-                else:
-                    result = self.calculate_dcf(
-                        historical_financials=historical_financials,
-                        forecast={'free_cash_flow': base_fcf},
-                        wacc=wacc,
-                        terminal_growth_rate=growth,
-                        mid_year_convention=True
-                    )
-                    row.append(result.get('equity_value'))
-            sensitivity_table.append(row)
+        # WACC down the rows, growth across the columns
+        waccs = np.asarray(wacc_range, dtype=np.float64)
+        growths = np.asarray(growth_range, dtype=np.float64)
+        valid = (waccs[:, None] > growths[None, :]) & (fcf.size > 0)
+        
+        if fcf.size:
+            equity_value = sensitivity_grid(fcf, waccs, growths, True, cash - debt)
+        else:
+            equity_value = np.zeros(valid.shape)
+        
+        # Invalid combinations (WACC <= growth) are reported as None
+        table = equity_value.astype(object)
+        table[~valid] = None
+        sensitivity_table = table.tolist()
         
         return {
             'wacc_range': wacc_range,
@@ -192,4 +264,62 @@ class DCFValuation:
                 'growth': base_growth
             }
         }
+    
+    def breakeven_growth(
+        self,
+        base_fcf: List[float],
+        target_equity: float,
+        wacc_range: List[float],
+        growth_range: List[float],
+        historical_financials: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Find, for each WACC, the lowest terminal growth rate that reaches a target equity value.
+        
+        With a positive final FCF, equity value rises with terminal growth, so each
+        WACC row is bisected over the sorted growth range rather than evaluated in full.
+        
+        Args:
+            base_fcf: Base case free cash flows
+            target_equity: Equity value to reach
+            wacc_range: Range of WACC values to test
+            growth_range: Range of growth rates to search
+            historical_financials: Historical financial data
+            
+        Returns:
+            Lowest qualifying growth rate per WACC (None where no valid rate reaches the target)
+        """
+        forecast_fcf = tuple(base_fcf)
+        if not forecast_fcf or forecast_fcf[-1] <= 0:
+            return {'error': 'Breakeven growth requires a positive final free cash flow'}
+        
+        net_cash = float(historical_financials.get('cash', 0)) - float(historical_financials.get('total_debt', 0))
+        final_fcf = float(forecast_fcf[-1])
+        growths = sorted(growth_range)
+        
+        breakeven = []
+        
+        for wacc in wacc_range:
+            # The forecast PV doesn't depend on growth, so each probe only prices the terminal value
+            pv_forecast, final_df = _pv_forecast(forecast_fcf, wacc, True)
+            
+            # Only growth rates below WACC are valid
+            lo, hi = 0, bisect.bisect_left(growths, wacc)
+            n_valid = hi
+            while lo < hi:
+                mid = (lo + hi) // 2
+                g = growths[mid]
+                equity_value = pv_forecast + final_fcf * (1.0 + g) / (wacc - g) * final_df + net_cash
+                if equity_value >= target_equity:
+                    hi = mid
+                else:
+                    lo = mid + 1
+            breakeven.append(growths[lo] if lo < n_valid else None)
+        
+        return {
+            'target_equity': target_equity,
+            'wacc_range': wacc_range,
+            'growth_range': growths,
+            'breakeven_growth': breakeven
+        }
 
@@ -1,15 +1,45 @@
 """GPCM (Guideline Public Company Method) valuation."""
 import logging
-from typing import Dict, Any, List
-from decimal import Decimal
+from types import MappingProxyType
+from typing import Dict, Any, List, Tuple
 import statistics
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Shared read-only default for missing sub-dicts, so lookups don't allocate
+_EMPTY = MappingProxyType({})
+
+# Below this size the statistics module beats the cost of building an array
+_SMALL_SAMPLE = 8
+
+
+def _indicated_values(
+    subject: float,
+    median_multiple: float,
+    mean_multiple: float,
+    liquidity_discount: float
+) -> Tuple[float, float, float, float]:
+    """Return (median value, mean value, discounted median value, discounted mean value)."""
+    discount_factor = 1.0 - liquidity_discount
+    iv_median = subject * median_multiple
+    iv_mean = subject * mean_multiple
+    return iv_median, iv_mean, iv_median * discount_factor, iv_mean * discount_factor
+
+
+def _median_mean(values: List[float]) -> Tuple[float, float]:
+    """Return the median and mean of a list of multiples."""
+    if len(values) < _SMALL_SAMPLE:
+        return statistics.median(values), statistics.mean(values)
+    arr = np.asarray(values, dtype=np.float64)
+    return float(np.median(arr)), float(np.mean(arr))
+
 
 class GPCMValuation:
     """Guideline Public Company Method valuation."""
     
+    __slots__ = ()
+    
     def calculate_gpcm(
         self,
         subject_metrics: Dict[str, float],
@@ -29,7 +59,7 @@ class GPCMValuation:
         Returns:
             GPCM valuation results
         """
-        logger.info(f"Calculating GPCM with {len(comparable_companies)} comparables")
+        logger.info("Calculating GPCM with %d comparables", len(comparable_companies))
         
         if not comparable_companies:
             return {'error': 'No comparable companies provided'}
@@ -43,47 +73,46 @@ class GPCMValuation:
         
         # Calculate subject company values using each multiple
         valuations_by_multiple = {}
+        total_adjusted = 0.0
+        n_adjusted = 0
         
         for multiple_type, multiples in comp_multiples.items():
             # Calculate statistics
-            median_multiple = statistics.median(multiples)
-            mean_multiple = statistics.mean(multiples)
+            median_multiple, mean_multiple = _median_mean(multiples)
             
             # Determine which metric to multiply
             subject_metric = self._get_subject_metric(subject_metrics, multiple_type)
             
             if subject_metric is None:
-                logger.warning(f"Subject metric not found for {multiple_type}")
+                logger.warning("Subject metric not found for %s", multiple_type)
                 continue
             
-            # Calculate indicated values
-            indicated_value_median = Decimal(str(subject_metric)) * Decimal(str(median_multiple))
-            indicated_value_mean = Decimal(str(subject_metric)) * Decimal(str(mean_multiple))
-            
-            # Apply liquidity discount
-            discount_factor = Decimal('1') - Decimal(str(liquidity_discount))
-            adjusted_value_median = indicated_value_median * discount_factor
-            adjusted_value_mean = indicated_value_mean * discount_factor
+            # Calculate indicated values and apply liquidity discount
+            (
+                indicated_value_median,
+                indicated_value_mean,
+                adjusted_value_median,
+                adjusted_value_mean
+            ) = _indicated_values(
+                float(subject_metric), float(median_multiple), float(mean_multiple), float(liquidity_discount)
+            )
             
             valuations_by_multiple[multiple_type] = {
                 'comparable_multiples': multiples,
                 'median_multiple': median_multiple,
                 'mean_multiple': mean_multiple,
                 'subject_metric': subject_metric,
-                'indicated_value_median': float(indicated_value_median),
-                'indicated_value_mean': float(indicated_value_mean),
-                'adjusted_value_median': float(adjusted_value_median),
-                'adjusted_value_mean': float(adjusted_value_mean),
+                'indicated_value_median': indicated_value_median,
+                'indicated_value_mean': indicated_value_mean,
+                'adjusted_value_median': adjusted_value_median,
+                'adjusted_value_mean': adjusted_value_mean,
                 'liquidity_discount': liquidity_discount
             }
+            total_adjusted += adjusted_value_median
+            n_adjusted += 1
         
         # Calculate weighted average (equal weight for simplicity)
-        all_adjusted_values = [
-            v['adjusted_value_median'] 
-            for v in valuations_by_multiple.values()
-        ]
-        
-        concluded_value = statistics.mean(all_adjusted_values) if all_adjusted_values else 0
+        concluded_value = total_adjusted / n_adjusted if n_adjusted else 0
         
         return {
             'concluded_value': concluded_value,
@@ -109,7 +138,7 @@ class GPCMValuation:
         multiples = []
         
         for comp in comparable_companies:
-            metrics = comp.get('metrics', {})
+            metrics = comp.get('metrics', _EMPTY)
             
             if multiple_type == 'EV/Revenue':
                 ev = metrics.get('enterprise_value')
@@ -167,22 +196,27 @@ class GPCMValuation:
         Returns:
             Adjusted valuation
         """
-        adjusted_value = Decimal(str(base_value))
-        adjustment_detail = []
+        # Each adjustment compounds on the running value: value *= (1 + pct)
+        pcts = np.fromiter(adjustments.values(), dtype=np.float64, count=len(adjustments))
+        cumulative = np.cumprod(1.0 + pcts)
+        # Value in effect before each step, so amount_i = value_before_i * pct_i
+        value_before = float(base_value) * np.concatenate(([1.0], cumulative[:-1]))
+        amounts = value_before * pcts
         
-        for factor, adjustment_pct in adjustments.items():
-            adjustment_amount = adjusted_value * Decimal(str(adjustment_pct))
-            adjusted_value += adjustment_amount
-            
-            adjustment_detail.append({
+        adjustment_detail = [
+            {
                 'factor': factor,
                 'percentage': adjustment_pct,
-                'amount': float(adjustment_amount)
-            })
+                'amount': amount
+            }
+            for factor, adjustment_pct, amount in zip(adjustments.keys(), adjustments.values(), amounts.tolist())
+        ]
+        
+        adjusted_value = float(base_value) * float(cumulative[-1]) if len(cumulative) else float(base_value)
         
         return {
             'base_value': base_value,
             'adjustments': adjustment_detail,
-            'adjusted_value': float(adjusted_value)
+            'adjusted_value': adjusted_value
         }
 
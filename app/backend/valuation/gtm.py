@@ -1,15 +1,56 @@
 """GTM (Guideline Transaction Method) valuation."""
 import logging
-from typing import Dict, Any, List
-from decimal import Decimal
-import statistics
+from types import MappingProxyType
+from typing import Dict, Any, List, Tuple
+import numpy as np
+
+from ._gtm_kernels import summarize_multiples, valid_multiples
 
 logger = logging.getLogger(__name__)
 
+# Shared read-only default for missing sub-dicts, so lookups don't allocate
+_EMPTY = MappingProxyType({})
+
+# Multiple type -> (numerator keys, denominator keys), first truthy key wins
+_MULTIPLE_KEYS = {
+    'EV/Revenue': (('enterprise_value', 'transaction_value'), ('revenue', 'ltm_revenue')),
+    'EV/EBITDA': (('enterprise_value', 'transaction_value'), ('ebitda', 'ltm_ebitda')),
+    'EV/Gross Profit': (('enterprise_value', 'transaction_value'), ('gross_profit',)),
+}
+
+# Multiple type -> subject company metric it is applied to
+_SUBJECT_KEY = {
+    'EV/Revenue': 'revenue',
+    'EV/EBITDA': 'ebitda',
+    'EV/Gross Profit': 'gross_profit',
+}
+
+# Per-multiple GTM results, one record per multiple type. Only types in
+# _MULTIPLE_KEYS produce records, so the label field fits the longest of them.
+GTM_RESULT_DTYPE = np.dtype([
+    ('type', f'U{max(map(len, _MULTIPLE_KEYS))}'),
+    ('median_mult', 'f8'),
+    ('mean_mult', 'f8'),
+    ('subject_metric', 'f8'),
+    ('iv_median', 'f8'),
+    ('iv_mean', 'f8'),
+])
+
+
+def _first_truthy(metrics: Dict[str, Any], keys: Tuple[str, ...]) -> float:
+    """Return the first truthy metric among keys, or NaN if none is set."""
+    for key in keys:
+        value = metrics.get(key)
+        if value:
+            return value
+    return np.nan
+
 
 class GTMValuation:
     """Guideline Transaction Method (Market Approach) valuation."""
     
+    __slots__ = ()
+    
     def calculate_gtm(
         self,
         subject_metrics: Dict[str, float],
@@ -27,57 +68,29 @@ class GTMValuation:
         Returns:
             GTM valuation results
         """
-        logger.info(f"Calculating GTM with {len(comparable_transactions)} transactions")
+        logger.info("Calculating GTM with %d transactions", len(comparable_transactions))
         
         if not comparable_transactions:
             return {'error': 'No comparable transactions provided'}
         
-        # Calculate multiples for each transaction
-        transaction_multiples = {}
-        for multiple_type in multiples_to_use:
-            transaction_multiples[multiple_type] = self._calculate_multiples(
-                comparable_transactions, multiple_type
-            )
-        
-        # Calculate subject company values using each multiple
-        valuations_by_multiple = {}
-        
-        for multiple_type, multiples in transaction_multiples.items():
-            if not multiples:
-                logger.warning(f"No valid multiples for {multiple_type}")
-                continue
-            
-            # Calculate statistics
-            median_multiple = statistics.median(multiples)
-            mean_multiple = statistics.mean(multiples)
-            
-            # Determine which metric to multiply
-            subject_metric = self._get_subject_metric(subject_metrics, multiple_type)
-            
-            if subject_metric is None or subject_metric == 0:
-                logger.warning(f"Subject metric not found or zero for {multiple_type}")
-                continue
-            
-            # Calculate indicated values (no liquidity discount for transactions)
-            indicated_value_median = Decimal(str(subject_metric)) * Decimal(str(median_multiple))
-            indicated_value_mean = Decimal(str(subject_metric)) * Decimal(str(mean_multiple))
-            
-            valuations_by_multiple[multiple_type] = {
-                'transaction_multiples': multiples,
-                'median_multiple': median_multiple,
-                'mean_multiple': mean_multiple,
-                'subject_metric': subject_metric,
-                'indicated_value_median': float(indicated_value_median),
-                'indicated_value_mean': float(indicated_value_mean),
+        results, multiples_by_type = self.multiple_results(
+            subject_metrics, comparable_transactions, multiples_to_use
+        )
+        
+        valuations_by_multiple = {
+            multiple_type: {
+                'transaction_multiples': multiples.tolist(),
+                'median_multiple': float(rec['median_mult']),
+                'mean_multiple': float(rec['mean_mult']),
+                'subject_metric': float(rec['subject_metric']),
+                'indicated_value_median': float(rec['iv_median']),
+                'indicated_value_mean': float(rec['iv_mean']),
             }
+            for (multiple_type, multiples), rec in zip(multiples_by_type.items(), results)
+        }
         
         # Calculate weighted average (equal weight for simplicity)
-        all_indicated_values = [
-            v['indicated_value_median'] 
-            for v in valuations_by_multiple.values()
-        ]
-        
-        concluded_value = statistics.mean(all_indicated_values) if all_indicated_values else 0
+        concluded_value = float(results['iv_median'].mean()) if len(results) else 0
         
         return {
             'concluded_value': concluded_value,
@@ -94,48 +107,85 @@ class GTMValuation:
             'methodology': 'gtm'
         }
     
-    def _calculate_multiples(
+    def multiple_results(
         self,
+        subject_metrics: Dict[str, float],
         comparable_transactions: List[Dict[str, Any]],
-        multiple_type: str
-    ) -> List[float]:
-        """Calculate a specific multiple for all transactions."""
-        multiples = []
+        multiples_to_use: List[str]
+    ) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """
+        Per-multiple GTM statistics for vectorized aggregation by callers.
         
-        for txn in comparable_transactions:
-            metrics = txn.get('metrics', {})
+        Args:
+            subject_metrics: Subject company financial metrics
+            comparable_transactions: List of comparable transaction data
+            multiples_to_use: List of multiple types (e.g., ['EV/Revenue', 'EV/EBITDA'])
+            
+        Returns:
+            Tuple of (GTM_RESULT_DTYPE record array with one row per usable multiple type,
+            transaction multiples by multiple type in the same order)
+        """
+        # Calculate multiples for each transaction
+        transaction_multiples = {}
+        for multiple_type in multiples_to_use:
+            transaction_multiples[multiple_type] = self._calculate_multiples(
+                comparable_transactions, multiple_type
+            )
+        
+        # Calculate subject company values using each multiple
+        rows = []
+        multiples_by_type = {}
+        
+        for multiple_type, multiples in transaction_multiples.items():
+            if multiples.size == 0:
+                logger.warning("No valid multiples for %s", multiple_type)
+                continue
             
-            if multiple_type == 'EV/Revenue':
-                ev = metrics.get('enterprise_value') or metrics.get('transaction_value')
-                revenue = metrics.get('revenue') or metrics.get('ltm_revenue')
-                if ev and revenue and revenue > 0:
-                    multiples.append(ev / revenue)
+            # Determine which metric to multiply
+            subject_metric = self._get_subject_metric(subject_metrics, multiple_type)
             
-            elif multiple_type == 'EV/EBITDA':
-                ev = metrics.get('enterprise_value') or metrics.get('transaction_value')
-                ebitda = metrics.get('ebitda') or metrics.get('ltm_ebitda')
-                if ev and ebitda and ebitda > 0:
-                    multiples.append(ev / ebitda)
+            if subject_metric is None or subject_metric == 0:
+                logger.warning("Subject metric not found or zero for %s", multiple_type)
+                continue
             
-            elif multiple_type == 'EV/Gross Profit':
-                ev = metrics.get('enterprise_value') or metrics.get('transaction_value')
-                gp = metrics.get('gross_profit')
-                if ev and gp and gp > 0:
-                    multiples.append(ev / gp)
+            # Statistics and indicated values (no liquidity discount for transactions)
+            median_multiple, mean_multiple, iv_median, iv_mean = summarize_multiples(
+                multiples, float(subject_metric)
+            )
+            rows.append((multiple_type, median_multiple, mean_multiple, subject_metric, iv_median, iv_mean))
+            multiples_by_type[multiple_type] = multiples
         
-        return multiples
+        return np.array(rows, dtype=GTM_RESULT_DTYPE), multiples_by_type
+    
+    def _calculate_multiples(
+        self,
+        comparable_transactions: List[Dict[str, Any]],
+        multiple_type: str
+    ) -> np.ndarray:
+        """Calculate a specific multiple for all transactions."""
+        keys = _MULTIPLE_KEYS.get(multiple_type)
+        if keys is None:
+            return np.empty(0, dtype=np.float64)
+        num_keys, denom_keys = keys
+        
+        n = len(comparable_transactions)
+        all_metrics = [txn.get('metrics', _EMPTY) for txn in comparable_transactions]
+        ev = np.fromiter(
+            (_first_truthy(m, num_keys) for m in all_metrics),
+            dtype=np.float64, count=n
+        )
+        denom = np.fromiter(
+            (_first_truthy(m, denom_keys) for m in all_metrics),
+            dtype=np.float64, count=n
+        )
+        
+        # Missing values are NaN; zero EV is treated as missing like before
+        return valid_multiples(ev, denom)
     
     def _get_subject_metric(self, subject_metrics: Dict[str, float], multiple_type: str) -> float:
         """Get the appropriate subject company metric for a multiple."""
-        
-        if multiple_type == 'EV/Revenue':
-            return subject_metrics.get('revenue')
-        elif multiple_type == 'EV/EBITDA':
-            return subject_metrics.get('ebitda')
-        elif multiple_type == 'EV/Gross Profit':
-            return subject_metrics.get('gross_profit')
-        
-        return None
+        key = _SUBJECT_KEY.get(multiple_type)
+        return subject_metrics.get(key) if key else None
     
     def filter_transactions(
         self,
@@ -157,35 +207,37 @@ class GTMValuation:
         Returns:
             Filtered list of transactions
         """
-        filtered = transactions
+        n = len(transactions)
+        mask = np.ones(n, dtype=bool)
         
         # Filter by industry
         if filters.get('industry_codes'):
             industry_codes = set(filters['industry_codes'])
-            filtered = [
-                txn for txn in filtered
-                if txn.get('industry_code') in industry_codes
-            ]
-        
-        # Filter by size
-        if filters.get('min_size'):
-            min_size = filters['min_size']
-            filtered = [
-                txn for txn in filtered
-                if txn.get('metrics', {}).get('transaction_value', 0) >= min_size
-            ]
-        
-        if filters.get('max_size'):
-            max_size = filters['max_size']
-            filtered = [
-                txn for txn in filtered
-                if txn.get('metrics', {}).get('transaction_value', float('inf')) <= max_size
-            ]
+            mask &= np.fromiter(
+                (txn.get('industry_code') in industry_codes for txn in transactions),
+                dtype=bool, count=n
+            )
+        
+        # Filter by size (missing values pass max_size but fail a positive min_size)
+        if filters.get('min_size') or filters.get('max_size'):
+            tx_value = np.fromiter(
+                (txn.get('metrics', _EMPTY).get('transaction_value', np.nan) for txn in transactions),
+                dtype=np.float64, count=n
+            )
+            missing = np.isnan(tx_value)
+            
+            if filters.get('min_size'):
+                mask &= np.where(missing, 0.0, tx_value) >= filters['min_size']
+            
+            if filters.get('max_size'):
+                mask &= np.where(missing, np.inf, tx_value) <= filters['max_size']
         
         # Filter by date (would need datetime parsing)
         # Simplified for now
         
-        logger.info(f"Filtered {len(transactions)} transactions to {len(filtered)}")
+        filtered = transactions if mask.all() else [transactions[i] for i in np.flatnonzero(mask)]
+        
+        logger.info("Filtered %d transactions to %d", len(transactions), len(filtered))
         
         return filtered
 
@@ -1,20 +1,56 @@
 """WACC (Weighted Average Cost of Capital) calculator."""
 import logging
-from typing import Dict, Any
-from decimal import Decimal
+from dataclasses import dataclass
+from typing import Dict, Any, Mapping, Union
+import numpy as np
+
+from ._wacc_kernels import wacc_grid
+
+ArrayLike = Union[float, np.ndarray]
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, slots=True)
+class WACCAssumptions:
+    """WACC inputs cast to floats once, for reuse across repeated calculations."""
+    risk_free_rate: float
+    equity_risk_premium: float
+    beta: float
+    cost_of_debt: float
+    tax_rate: float
+    debt_weight: float
+    equity_weight: float
+    size_premium: float = 0.0
+    company_specific_premium: float = 0.0
+    
+    @classmethod
+    def from_dict(cls, inputs: Mapping[str, Any]) -> 'WACCAssumptions':
+        """Build from the calculate_wacc input dictionary."""
+        return cls(
+            risk_free_rate=float(inputs['risk_free_rate']),
+            equity_risk_premium=float(inputs['equity_risk_premium']),
+            beta=float(inputs['beta']),
+            cost_of_debt=float(inputs['cost_of_debt']),
+            tax_rate=float(inputs['tax_rate']),
+            debt_weight=float(inputs['debt_weight']),
+            equity_weight=float(inputs['equity_weight']),
+            size_premium=float(inputs.get('size_premium', 0)),
+            company_specific_premium=float(inputs.get('company_specific_premium', 0))
+        )
+
+
 class WACCCalculator:
     """Calculate Weighted Average Cost of Capital."""
     
-    def calculate_wacc(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+    __slots__ = ()
+    
+    def calculate_wacc(self, inputs: Union[Dict[str, Any], WACCAssumptions]) -> Dict[str, Any]:
         """
         Calculate WACC from inputs.
         
         Args:
-            inputs: Dictionary with keys:
+            inputs: WACCAssumptions, or a dictionary with keys:
                 - risk_free_rate: float
                 - equity_risk_premium: float
                 - beta: float
@@ -31,19 +67,21 @@ class WACCCalculator:
         logger.info("Calculating WACC")
         
         # Extract inputs
-        rf = Decimal(str(inputs['risk_free_rate']))
-        erp = Decimal(str(inputs['equity_risk_premium']))
-        beta = Decimal(str(inputs['beta']))
-        size_prem = Decimal(str(inputs.get('size_premium', 0)))
-        co_specific = Decimal(str(inputs.get('company_specific_premium', 0)))
-        kd = Decimal(str(inputs['cost_of_debt']))
-        tax = Decimal(str(inputs['tax_rate']))
-        wd = Decimal(str(inputs['debt_weight']))
-        we = Decimal(str(inputs['equity_weight']))
+        if not isinstance(inputs, WACCAssumptions):
+            inputs = WACCAssumptions.from_dict(inputs)
+        rf = inputs.risk_free_rate
+        erp = inputs.equity_risk_premium
+        beta = inputs.beta
+        size_prem = inputs.size_premium
+        co_specific = inputs.company_specific_premium
+        kd = inputs.cost_of_debt
+        tax = inputs.tax_rate
+        wd = inputs.debt_weight
+        we = inputs.equity_weight
         
         # Validate weights sum to 1
-        if abs(wd + we - Decimal('1.0')) > Decimal('0.01'):
-            logger.warning(f"Debt and equity weights don't sum to 1.0: {wd + we}")
+        if abs(wd + we - 1.0) > 0.01:
+            logger.warning("Debt and equity weights don't sum to 1.0: %s", wd + we)
         
         # Calculate Cost of Equity using CAPM + adjustments
         # Ke = Rf + Beta * ERP + Size Premium + Company-Specific Risk
@@ -51,28 +89,122 @@ class WACCCalculator:
         
         # Calculate After-tax Cost of Debt
         # Kd(1-T)
-        after_tax_cost_of_debt = kd * (Decimal('1') - tax)
+        after_tax_cost_of_debt = kd * (1.0 - tax)
         
         # Calculate WACC
         # WACC = (We * Ke) + (Wd * Kd * (1-T))
         wacc = (we * cost_of_equity) + (wd * after_tax_cost_of_debt)
         
         return {
-            'cost_of_equity': float(cost_of_equity),
+            'cost_of_equity': cost_of_equity,
             'cost_of_equity_components': {
-                'risk_free_rate': float(rf),
-                'beta_times_erp': float(beta * erp),
-                'size_premium': float(size_prem),
-                'company_specific_premium': float(co_specific)
+                'risk_free_rate': rf,
+                'beta_times_erp': beta * erp,
+                'size_premium': size_prem,
+                'company_specific_premium': co_specific
             },
-            'after_tax_cost_of_debt': float(after_tax_cost_of_debt),
-            'wacc': float(wacc),
+            'after_tax_cost_of_debt': after_tax_cost_of_debt,
+            'wacc': wacc,
             'capital_structure': {
-                'equity_weight': float(we),
-                'debt_weight': float(wd)
+                'equity_weight': we,
+                'debt_weight': wd
             }
         }
     
+    def calculate_wacc_batch(
+        self,
+        risk_free_rate: ArrayLike,
+        equity_risk_premium: ArrayLike,
+        beta: ArrayLike,
+        cost_of_debt: ArrayLike,
+        tax_rate: ArrayLike,
+        debt_weight: ArrayLike,
+        equity_weight: ArrayLike,
+        size_premium: ArrayLike = 0.0,
+        company_specific_premium: ArrayLike = 0.0
+    ) -> Dict[str, np.ndarray]:
+        """
+        Calculate WACC over arrays of inputs using NumPy broadcasting.
+        
+        Any argument may be a scalar or an array; shapes broadcast as usual.
+        For sensitivity grids, pass axes from np.ix_ (e.g. beta and ERP
+        ranges) to get the full outer product without building a meshgrid.
+        
+        Args:
+            risk_free_rate: Risk-free rate(s)
+            equity_risk_premium: Equity risk premium(s)
+            beta: Levered beta(s)
+            cost_of_debt: Pre-tax cost(s) of debt
+            tax_rate: Tax rate(s)
+            debt_weight: Debt weight(s) in the capital structure
+            equity_weight: Equity weight(s) in the capital structure
+            size_premium: Size premium(s)
+            company_specific_premium: Company-specific premium(s)
+            
+        Returns:
+            Dictionary of cost_of_equity, after_tax_cost_of_debt and wacc arrays
+        """
+        cost_of_equity = (
+            np.asarray(risk_free_rate, dtype=np.float64)
+            + np.asarray(beta, dtype=np.float64) * np.asarray(equity_risk_premium, dtype=np.float64)
+            + np.asarray(size_premium, dtype=np.float64)
+            + np.asarray(company_specific_premium, dtype=np.float64)
+        )
+        after_tax_cost_of_debt = (
+            np.asarray(cost_of_debt, dtype=np.float64) * (1.0 - np.asarray(tax_rate, dtype=np.float64))
+        )
+        wacc = (
+            np.asarray(equity_weight, dtype=np.float64) * cost_of_equity
+            + np.asarray(debt_weight, dtype=np.float64) * after_tax_cost_of_debt
+        )
+        
+        return {
+            'cost_of_equity': cost_of_equity,
+            'after_tax_cost_of_debt': after_tax_cost_of_debt,
+            'wacc': wacc
+        }
+    
+    def calculate_wacc_grid(
+        self,
+        inputs: Union[Dict[str, Any], WACCAssumptions],
+        betas: np.ndarray,
+        equity_risk_premiums: np.ndarray
+    ) -> Dict[str, Any]:
+        """
+        Calculate a WACC sensitivity grid over beta and equity risk premium.
+        
+        Args:
+            inputs: Same as calculate_wacc; beta and equity_risk_premium are ignored
+            betas: Beta values (grid rows)
+            equity_risk_premiums: Equity risk premium values (grid columns)
+            
+        Returns:
+            Dictionary with the beta and ERP axes and the WACC grid
+        """
+        if not isinstance(inputs, WACCAssumptions):
+            # The grid supplies beta and ERP, so the dictionary may omit them
+            inputs = WACCAssumptions.from_dict({'beta': 0.0, 'equity_risk_premium': 0.0, **inputs})
+        betas = np.ascontiguousarray(betas, dtype=np.float64)
+        equity_risk_premiums = np.ascontiguousarray(equity_risk_premiums, dtype=np.float64)
+        
+        grid = wacc_grid(
+            inputs.risk_free_rate,
+            equity_risk_premiums,
+            betas,
+            inputs.size_premium,
+            inputs.company_specific_premium,
+            inputs.cost_of_debt,
+            inputs.tax_rate,
+            inputs.debt_weight,
+            inputs.equity_weight
+        )
+        
+        return {
+            'betas': betas,
+            'equity_risk_premiums': equity_risk_premiums,
+            'wacc': grid
+        }
+    
     def calculate_levered_beta(
         self,
         unlevered_beta: float,
@@ -92,13 +224,7 @@ class WACCCalculator:
         Returns:
             Levered (equity) beta
         """
-        bu = Decimal(str(unlevered_beta))
-        de = Decimal(str(debt_to_equity))
-        t = Decimal(str(tax_rate))
-        
-        levered_beta = bu * (Decimal('1') + (Decimal('1') - t) * de)
-        
-        return float(levered_beta)
+        return float(unlevered_beta) * (1.0 + (1.0 - float(tax_rate)) * float(debt_to_equity))
     
     def calculate_unlevered_beta(
         self,
@@ -119,11 +245,5 @@ class WACCCalculator:
         Returns:
             Unlevered (asset) beta
         """
-        bl = Decimal(str(levered_beta))
-        de = Decimal(str(debt_to_equity))
-        t = Decimal(str(tax_rate))
-        
-        unlevered_beta = bl / (Decimal('1') + (Decimal('1') - t) * de)
-        
-        return float(unlevered_beta)
+        return float(levered_beta) / (1.0 + (1.0 - float(tax_rate)) * float(debt_to_equity))
 
@@ -1,20 +1,54 @@
 """Excel workbook generator with formulas."""
+import io
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 from datetime import datetime
 import xlsxwriter
-from google.cloud import storage
 
 from config import settings
 
 logger = logging.getLogger(__name__)
 
+XLSX_CONTENT_TYPE = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+
+# Cell format specs; Format objects are bound to a workbook so only these are shared
+_FORMAT_SPECS = {
+    'title': {'bold': True, 'font_size': 16},
+    'header': {'bold': True, 'bg_color': '#4472C4', 'font_color': 'white'},
+    'currency': {'num_format': '$#,##0'},
+    'currency_decimal': {'num_format': '$#,##0.00'},
+    'percent': {'num_format': '0.0%'},
+    'number': {'num_format': '#,##0'},
+    'date': {'num_format': 'mm/dd/yyyy'},
+    'bold': {'bold': True},
+    'subtotal': {'bold': True, 'top': 1, 'bottom': 6},
+}
+
+# Statements with at least this many line items are written in constant_memory mode
+_CONSTANT_MEMORY_MIN_ROWS = 2000
+
+# Column letters for formula construction (A..IV); wider sheets fall back to xl_col_to_name
+_COL = tuple(xlsxwriter.utility.xl_col_to_name(c) for c in range(256))
+
+
+def _col_name(col: int) -> str:
+    """Column letters for a zero-based column index."""
+    return _COL[col] if col < len(_COL) else xlsxwriter.utility.xl_col_to_name(col)
+
 
 class WorkbookGenerator:
     """Generate formula-rich Excel workbooks."""
     
     def __init__(self):
-        self.storage_client = storage.Client(project=settings.project_id)
+        self._storage_client = None
+    
+    @property
+    def storage_client(self):
+        """GCS client, created on first upload so the import stays off the startup path."""
+        if self._storage_client is None:
+            from google.cloud import storage
+            self._storage_client = storage.Client(project=settings.project_id)
+        return self._storage_client
     
     def generate_consolidated_workbook(
         self,
@@ -35,13 +69,51 @@ class WorkbookGenerator:
         Returns:
             GCS path to generated workbook
         """
-        logger.info(f"Generating workbook for engagement {engagement_id}")
+        logger.info("Generating workbook for engagement %s", engagement_id)
         
-        # Create temp file
-        temp_file = f"/tmp/workbook_{engagement_id}_{datetime.now().strftime('%Y%m%d%H%M%S')}.xlsx"
+        buffer = self.build_consolidated_workbook(engagement_data, normalized_data)
         
-        # Create workbook
-        workbook = xlsxwriter.Workbook(temp_file)
+        # Upload to GCS
+        gcs_path = f"{tenant_id}/{engagement_id}/workbook/consolidated.xlsx"
+        bucket = self.storage_client.bucket(settings.artifacts_bucket)
+        blob = bucket.blob(gcs_path)
+        blob.upload_from_file(buffer, content_type=XLSX_CONTENT_TYPE, rewind=True)
+        
+        logger.info("Workbook uploaded to %s", gcs_path)
+        
+        return gcs_path
+    
+    def build_consolidated_workbook(
+        self,
+        engagement_data: Dict[str, Any],
+        normalized_data: Dict[str, Any]
+    ) -> io.BytesIO:
+        """
+        Build the consolidated workbook in memory without uploading it.
+        
+        Args:
+            engagement_data: Engagement metadata
+            normalized_data: Normalized financial data
+            
+        Returns:
+            Buffer holding the .xlsx bytes, rewound so it can be streamed directly
+        """
+        # Prepare statement rows before the workbook is opened
+        is_rows = self._prepare_statement_rows(normalized_data.get('income_statement', {}))
+        bs_rows = self._prepare_statement_rows(normalized_data.get('balance_sheet', {}))
+        cf_rows = self._prepare_statement_rows(normalized_data.get('cash_flow', {}))
+        
+        # Build the workbook into a buffer so it can be uploaded without a temp file.
+        # Large statements flush each row as it is written instead of holding every
+        # cell until close(); every sheet below writes its rows in ascending order.
+        line_item_count = len(is_rows[1]) + len(bs_rows[1]) + len(cf_rows[1])
+        if line_item_count >= _CONSTANT_MEMORY_MIN_ROWS:
+            options = {'constant_memory': True}
+        else:
+            options = {'in_memory': True}
+        
+        buffer = io.BytesIO()
+        workbook = xlsxwriter.Workbook(buffer, options)
         
         # Define formats
         formats = self._create_formats(workbook)
@@ -50,9 +122,9 @@ class WorkbookGenerator:
         self._create_cover_sheet(workbook, formats, engagement_data)
         self._create_assumptions_sheet(workbook, formats, engagement_data)
         self._create_raw_imports_sheet(workbook, formats, normalized_data)
-        self._create_normalized_is(workbook, formats, normalized_data.get('income_statement', {}))
-        self._create_normalized_bs(workbook, formats, normalized_data.get('balance_sheet', {}))
-        self._create_normalized_cf(workbook, formats, normalized_data.get('cash_flow', {}))
+        self._create_normalized_is(workbook, formats, *is_rows)
+        self._create_normalized_bs(workbook, formats, *bs_rows)
+        self._create_normalized_cf(workbook, formats, *cf_rows)
         self._create_adjustments_sheet(workbook, formats)
         self._create_ratios_sheet(workbook, formats)
         self._create_forecast_sheet(workbook, formats)
@@ -60,52 +132,35 @@ class WorkbookGenerator:
         self._create_audit_log_sheet(workbook, formats)
         
         workbook.close()
+        buffer.seek(0)
         
-        # Upload to GCS
-        gcs_path = f"{tenant_id}/{engagement_id}/workbook/consolidated.xlsx"
-        bucket = self.storage_client.bucket(settings.artifacts_bucket)
-        blob = bucket.blob(gcs_path)
-        blob.upload_from_filename(temp_file)
-        
-        logger.info(f"Workbook uploaded to {gcs_path}")
-        
-        return gcs_path
+        return buffer
     
     def _create_formats(self, workbook: xlsxwriter.Workbook) -> Dict[str, Any]:
         """Create cell formats."""
-        return {
-            'title': workbook.add_format({'bold': True, 'font_size': 16}),
-            'header': workbook.add_format({'bold': True, 'bg_color': '#4472C4', 'font_color': 'white'}),
-            'currency': workbook.add_format({'num_format': '$#,##0'}),
-            'currency_decimal': workbook.add_format({'num_format': '$#,##0.00'}),
-            'percent': workbook.add_format({'num_format': '0.0%'}),
-            'number': workbook.add_format({'num_format': '#,##0'}),
-            'date': workbook.add_format({'num_format': 'mm/dd/yyyy'}),
-            'bold': workbook.add_format({'bold': True}),
-            'subtotal': workbook.add_format({'bold': True, 'top': 1, 'bottom': 6}),
-        }
+        return {name: workbook.add_format(spec) for name, spec in _FORMAT_SPECS.items()}
     
     def _create_cover_sheet(self, workbook, formats, engagement_data):
         """Create cover/summary sheet."""
         sheet = workbook.add_worksheet('Cover')
         
-        sheet.write('A1', 'Valuation Workbench', formats['title'])
-        sheet.write('A2', 'Consolidated Financial Analysis')
+        sheet.write(0, 0, 'Valuation Workbench', formats['title'])
+        sheet.write(1, 0, 'Consolidated Financial Analysis')
         
-        sheet.write('A4', 'Engagement:', formats['bold'])
-        sheet.write('B4', engagement_data.get('name', 'N/A'))
+        sheet.write(3, 0, 'Engagement:', formats['bold'])
+        sheet.write(3, 1, engagement_data.get('name', 'N/A'))
         
-        sheet.write('A5', 'Client:', formats['bold'])
-        sheet.write('B5', engagement_data.get('client_name', 'N/A'))
+        sheet.write(4, 0, 'Client:', formats['bold'])
+        sheet.write(4, 1, engagement_data.get('client_name', 'N/A'))
         
-        sheet.write('A6', 'Currency:', formats['bold'])
-        sheet.write('B6', engagement_data.get('currency', 'USD'))
+        sheet.write(5, 0, 'Currency:', formats['bold'])
+        sheet.write(5, 1, engagement_data.get('currency', 'USD'))
         
-        sheet.write('A7', 'Fiscal Year End:', formats['bold'])
-        sheet.write('B7', engagement_data.get('fiscal_year_end', 'N/A'))
+        sheet.write(6, 0, 'Fiscal Year End:', formats['bold'])
+        sheet.write(6, 1, engagement_data.get('fiscal_year_end', 'N/A'))
         
-        sheet.write('A8', 'Generated:', formats['bold'])
-        sheet.write('B8', datetime.now(), formats['date'])
+        sheet.write(7, 0, 'Generated:', formats['bold'])
+        sheet.write(7, 1, datetime.now(), formats['date'])
         
         sheet.set_column('A:A', 20)
         sheet.set_column('B:B', 30)
@@ -114,26 +169,26 @@ class WorkbookGenerator:
         """Create assumptions sheet."""
         sheet = workbook.add_worksheet('Assumptions')
         
-        sheet.write('A1', 'Valuation Assumptions', formats['header'])
+        sheet.write(0, 0, 'Valuation Assumptions', formats['header'])
         
-        sheet.write('A3', 'Revenue Growth Rate (Annual):', formats['bold'])
-        sheet.write('B3', 0.10, formats['percent'])  # Default 10%
+        sheet.write(2, 0, 'Revenue Growth Rate (Annual):', formats['bold'])
+        sheet.write(2, 1, 0.10, formats['percent'])  # Default 10%
         sheet.set_row(2, None, None, {'hidden': False, 'level': 0})
         
-        sheet.write('A4', 'Terminal Growth Rate:', formats['bold'])
-        sheet.write('B4', 0.025, formats['percent'])  # Default 2.5%
+        sheet.write(3, 0, 'Terminal Growth Rate:', formats['bold'])
+        sheet.write(3, 1, 0.025, formats['percent'])  # Default 2.5%
         
-        sheet.write('A5', 'Risk-free Rate:', formats['bold'])
-        sheet.write('B5', 0.045, formats['percent'])  # Default 4.5%
+        sheet.write(4, 0, 'Risk-free Rate:', formats['bold'])
+        sheet.write(4, 1, 0.045, formats['percent'])  # Default 4.5%
         
-        sheet.write('A6', 'Equity Risk Premium:', formats['bold'])
-        sheet.write('B6', 0.06, formats['percent'])  # Default 6%
+        sheet.write(5, 0, 'Equity Risk Premium:', formats['bold'])
+        sheet.write(5, 1, 0.06, formats['percent'])  # Default 6%
         
-        sheet.write('A7', 'Beta:', formats['bold'])
-        sheet.write('B7', 1.0)
+        sheet.write(6, 0, 'Beta:', formats['bold'])
+        sheet.write(6, 1, 1.0)
         
-        sheet.write('A8', 'Tax Rate:', formats['bold'])
-        sheet.write('B8', 0.25, formats['percent'])  # Default 25%
+        sheet.write(7, 0, 'Tax Rate:', formats['bold'])
+        sheet.write(7, 1, 0.25, formats['percent'])  # Default 25%
         
         # Named ranges for assumptions
         workbook.define_name('RevenueGrowth', '=Assumptions!$B$3')
@@ -150,89 +205,95 @@ class WorkbookGenerator:
         """Create raw imports sheet."""
         sheet = workbook.add_worksheet('Raw Imports')
         
-        sheet.write('A1', 'Raw Imported Data', formats['header'])
-        sheet.write('A2', 'This sheet contains snapshots of parsed source documents')
+        sheet.write(0, 0, 'Raw Imported Data', formats['header'])
+        sheet.write(1, 0, 'This sheet contains snapshots of parsed source documents')
         
         # Would add actual raw data here
         sheet.set_column('A:A', 40)
     
-    def _create_normalized_is(self, workbook, formats, is_data):
+    def _prepare_statement_rows(self, statement_data: Dict[str, Any]) -> Tuple[List[str], List[Tuple[str, List[float]]]]:
+        """Extract periods and (label, values) rows for a normalized statement sheet."""
+        periods = statement_data.get('periods', [])
+        rows = []
+        for item in statement_data.get('line_items', []):
+            # Bind the item's lookup once rather than re-resolving it for every period
+            get_value = item['values'].get
+            rows.append((item['label'], [float(get_value(period, 0)) for period in periods]))
+        return periods, rows
+    
+    def _create_normalized_is(self, workbook, formats, periods, rows):
         """Create normalized income statement with formulas."""
         sheet = workbook.add_worksheet('Income Statement')
         
-        periods = is_data.get('periods', [])
-        line_items = is_data.get('line_items', [])
+        if not periods and not rows:
+            sheet.write(0, 0, 'Income Statement - no data available')
+            return
         
         # Headers
-        sheet.write('A1', 'Income Statement', formats['header'])
-        for col, period in enumerate(periods, start=1):
-            sheet.write(0, col, period, formats['header'])
+        sheet.write_row(0, 0, ['Income Statement', *periods], formats['header'])
         
         # Line items
+        currency = formats['currency']
         row = 1
-        for item in line_items:
-            sheet.write(row, 0, item['label'])
-            for col, period in enumerate(periods, start=1):
-                value = item['values'].get(period, 0)
-                sheet.write(row, col, float(value), formats['currency'])
+        for label, values in rows:
+            sheet.write(row, 0, label)
+            sheet.write_row(row, 1, values, currency)
             row += 1
         
-        # Add calculated fields with formulas
-        if len(periods) > 0:
+        # Add calculated fields with formulas (the margin formula reads rows 3 and 4)
+        if len(periods) > 0 and len(rows) >= 3:
             # Gross Margin %
             sheet.write(row, 0, 'Gross Margin %', formats['bold'])
-            for col in range(1, len(periods) + 1):
-                # Formula: Gross Profit / Revenue
-                formula = f'=IF({xlsxwriter.utility.xl_col_to_name(col)}3=0,0,{xlsxwriter.utility.xl_col_to_name(col)}4/{xlsxwriter.utility.xl_col_to_name(col)}3)'
-                sheet.write_formula(row, col, formula, formats['percent'])
+            # Formula: Gross Profit / Revenue
+            formulas = [
+                f'=IF({letter}3=0,0,{letter}4/{letter}3)'
+                for letter in map(_col_name, range(1, len(periods) + 1))
+            ]
+            sheet.write_row(row, 1, formulas, formats['percent'])
             row += 1
         
         sheet.set_column('A:A', 35)
         sheet.set_column('B:Z', 15)
     
-    def _create_normalized_bs(self, workbook, formats, bs_data):
+    def _create_normalized_bs(self, workbook, formats, periods, rows):
         """Create normalized balance sheet with formulas."""
         sheet = workbook.add_worksheet('Balance Sheet')
         
-        periods = bs_data.get('periods', [])
-        line_items = bs_data.get('line_items', [])
+        if not periods and not rows:
+            sheet.write(0, 0, 'Balance Sheet - no data available')
+            return
         
         # Headers
-        sheet.write('A1', 'Balance Sheet', formats['header'])
-        for col, period in enumerate(periods, start=1):
-            sheet.write(0, col, period, formats['header'])
+        sheet.write_row(0, 0, ['Balance Sheet', *periods], formats['header'])
         
         # Line items
+        currency = formats['currency']
         row = 1
-        for item in line_items:
-            sheet.write(row, 0, item['label'])
-            for col, period in enumerate(periods, start=1):
-                value = item['values'].get(period, 0)
-                sheet.write(row, col, float(value), formats['currency'])
+        for label, values in rows:
+            sheet.write(row, 0, label)
+            sheet.write_row(row, 1, values, currency)
             row += 1
         
         sheet.set_column('A:A', 35)
         sheet.set_column('B:Z', 15)
     
-    def _create_normalized_cf(self, workbook, formats, cf_data):
+    def _create_normalized_cf(self, workbook, formats, periods, rows):
         """Create normalized cash flow statement."""
         sheet = workbook.add_worksheet('Cash Flow')
         
-        periods = cf_data.get('periods', [])
-        line_items = cf_data.get('line_items', [])
+        if not periods and not rows:
+            sheet.write(0, 0, 'Cash Flow Statement - no data available')
+            return
         
         # Headers
-        sheet.write('A1', 'Cash Flow Statement', formats['header'])
-        for col, period in enumerate(periods, start=1):
-            sheet.write(0, col, period, formats['header'])
+        sheet.write_row(0, 0, ['Cash Flow Statement', *periods], formats['header'])
         
         # Line items
+        currency = formats['currency']
         row = 1
-        for item in line_items:
-            sheet.write(row, 0, item['label'])
-            for col, period in enumerate(periods, start=1):
-                value = item['values'].get(period, 0)
-                sheet.write(row, col, float(value), formats['currency'])
+        for label, values in rows:
+            sheet.write(row, 0, label)
+            sheet.write_row(row, 1, values, currency)
             row += 1
         
         sheet.set_column('A:A', 35)
@@ -242,18 +303,15 @@ class WorkbookGenerator:
         """Create quality of earnings adjustments sheet."""
         sheet = workbook.add_worksheet('Adjustments')
         
-        sheet.write('A1', 'Quality of Earnings Adjustments', formats['header'])
+        sheet.write(0, 0, 'Quality of Earnings Adjustments', formats['header'])
         
         headers = ['Adjustment Type', 'Description', 'Amount', 'Period', 'Justification']
-        for col, header in enumerate(headers):
-            sheet.write(1, col, header, formats['header'])
+        sheet.write_row(1, 0, headers, formats['header'])
         
         # Example adjustment
-        sheet.write('A3', 'Owner Compensation')
-        sheet.write('B3', 'Normalize to market rate')
-        sheet.write('C3', 50000, formats['currency'])
-        sheet.write('D3', '2023')
-        sheet.write('E3', 'Owner comp $200k vs market $150k')
+        sheet.write_row(2, 0, ['Owner Compensation', 'Normalize to market rate'])
+        sheet.write(2, 2, 50000, formats['currency'])
+        sheet.write_row(2, 3, ['2023', 'Owner comp $200k vs market $150k'])
         
         sheet.set_column('A:A', 25)
         sheet.set_column('B:B', 35)
@@ -265,23 +323,23 @@ class WorkbookGenerator:
         """Create financial ratios sheet."""
         sheet = workbook.add_worksheet('Ratios')
         
-        sheet.write('A1', 'Financial Ratios & KPIs', formats['header'])
+        sheet.write(0, 0, 'Financial Ratios & KPIs', formats['header'])
         
         # Profitability ratios
-        sheet.write('A3', 'Profitability', formats['bold'])
-        sheet.write('A4', 'Gross Margin %')
-        sheet.write('A5', 'Operating Margin %')
-        sheet.write('A6', 'Net Margin %')
+        sheet.write(2, 0, 'Profitability', formats['bold'])
+        sheet.write(3, 0, 'Gross Margin %')
+        sheet.write(4, 0, 'Operating Margin %')
+        sheet.write(5, 0, 'Net Margin %')
         
         # Liquidity ratios
-        sheet.write('A8', 'Liquidity', formats['bold'])
-        sheet.write('A9', 'Current Ratio')
-        sheet.write('A10', 'Quick Ratio')
+        sheet.write(7, 0, 'Liquidity', formats['bold'])
+        sheet.write(8, 0, 'Current Ratio')
+        sheet.write(9, 0, 'Quick Ratio')
         
         # Leverage ratios
-        sheet.write('A12', 'Leverage', formats['bold'])
-        sheet.write('A13', 'Debt to Equity')
-        sheet.write('A14', 'Interest Coverage')
+        sheet.write(11, 0, 'Leverage', formats['bold'])
+        sheet.write(12, 0, 'Debt to Equity')
+        sheet.write(13, 0, 'Interest Coverage')
         
         sheet.set_column('A:A', 30)
         sheet.set_column('B:Z', 15)
@@ -290,20 +348,17 @@ class WorkbookGenerator:
         """Create forecast sheet with driver-based model."""
         sheet = workbook.add_worksheet('Forecast')
         
-        sheet.write('A1', 'Financial Forecast', formats['header'])
+        sheet.write(0, 0, 'Financial Forecast', formats['header'])
         
         # Forecast periods
-        sheet.write('A3', 'Period')
-        for col in range(1, 6):  # 5 forecast years
-            sheet.write(2, col, f'Year {col}', formats['header'])
+        sheet.write(2, 0, 'Period')
+        sheet.write_row(2, 1, [f'Year {col}' for col in range(1, 6)], formats['header'])  # 5 forecast years
         
         # Revenue forecast
-        sheet.write('A4', 'Revenue')
-        sheet.write('B4', '=\'Income Statement\'!B3')  # Link to historical
-        for col in range(2, 6):
-            # Formula: Prior year * (1 + growth rate)
-            formula = f'={xlsxwriter.utility.xl_col_to_name(col)}4*(1+RevenueGrowth)'
-            sheet.write_formula(3, col, formula, formats['currency'])
+        sheet.write(3, 0, 'Revenue')
+        sheet.write(3, 1, '=\'Income Statement\'!B3')  # Link to historical
+        # Formula: Prior year * (1 + growth rate)
+        sheet.write_row(3, 2, [f'={_col_name(col)}4*(1+RevenueGrowth)' for col in range(2, 6)], formats['currency'])
         
         sheet.set_column('A:A', 30)
         sheet.set_column('B:Z', 15)
@@ -312,32 +367,32 @@ class WorkbookGenerator:
         """Create valuation calculations sheet."""
         sheet = workbook.add_worksheet('Valuation')
         
-        sheet.write('A1', 'Business Valuation', formats['header'])
+        sheet.write(0, 0, 'Business Valuation', formats['header'])
         
         # WACC calculation
-        sheet.write('A3', 'WACC Calculation', formats['bold'])
-        sheet.write('A4', 'Cost of Equity')
-        sheet.write('B4', '=RiskFreeRate+Beta*EquityRiskPremium', formats['percent'])
+        sheet.write(2, 0, 'WACC Calculation', formats['bold'])
+        sheet.write(3, 0, 'Cost of Equity')
+        sheet.write(3, 1, '=RiskFreeRate+Beta*EquityRiskPremium', formats['percent'])
         
-        sheet.write('A5', 'After-tax Cost of Debt')
-        sheet.write('B5', '=0.06*(1-TaxRate)', formats['percent'])  # Assuming 6% pre-tax
+        sheet.write(4, 0, 'After-tax Cost of Debt')
+        sheet.write(4, 1, '=0.06*(1-TaxRate)', formats['percent'])  # Assuming 6% pre-tax
         
-        sheet.write('A6', 'WACC')
-        sheet.write('B6', '=B4*0.8+B5*0.2', formats['percent'])  # Assuming 80/20 equity/debt
+        sheet.write(5, 0, 'WACC')
+        sheet.write(5, 1, '=B4*0.8+B5*0.2', formats['percent'])  # Assuming 80/20 equity/debt
         
         # Valuation methods
-        sheet.write('A8', 'Valuation Methods', formats['bold'])
-        sheet.write('A9', 'DCF Value')
-        sheet.write('B9', 0, formats['currency'])  # Placeholder
+        sheet.write(7, 0, 'Valuation Methods', formats['bold'])
+        sheet.write(8, 0, 'DCF Value')
+        sheet.write(8, 1, 0, formats['currency'])  # Placeholder
         
-        sheet.write('A10', 'GPCM Value')
-        sheet.write('B10', 0, formats['currency'])  # Placeholder
+        sheet.write(9, 0, 'GPCM Value')
+        sheet.write(9, 1, 0, formats['currency'])  # Placeholder
         
-        sheet.write('A11', 'GTM Value')
-        sheet.write('B11', 0, formats['currency'])  # Placeholder
+        sheet.write(10, 0, 'GTM Value')
+        sheet.write(10, 1, 0, formats['currency'])  # Placeholder
         
-        sheet.write('A13', 'Concluded Value', formats['subtotal'])
-        sheet.write_formula('B13', '=(B9*0.5+B10*0.3+B11*0.2)', formats['currency'])
+        sheet.write(12, 0, 'Concluded Value', formats['subtotal'])
+        sheet.write_formula(12, 1, '=(B9*0.5+B10*0.3+B11*0.2)', formats['currency'])
         
         sheet.set_column('A:A', 30)
         sheet.set_column('B:B', 20)
@@ -346,17 +401,14 @@ class WorkbookGenerator:
         """Create audit trail sheet."""
         sheet = workbook.add_worksheet('Audit Log')
         
-        sheet.write('A1', 'Audit Trail', formats['header'])
+        sheet.write(0, 0, 'Audit Trail', formats['header'])
         
         headers = ['Timestamp', 'User', 'Action', 'Details', 'IP Address']
-        for col, header in enumerate(headers):
-            sheet.write(1, col, header, formats['header'])
+        sheet.write_row(1, 0, headers, formats['header'])
         
         # Sample entry
-        sheet.write('A3', datetime.now(), formats['date'])
-        sheet.write('B3', 'System')
-        sheet.write('C3', 'Workbook Generated')
-        sheet.write('D3', 'Consolidated workbook created from parsed documents')
+        sheet.write(2, 0, datetime.now(), formats['date'])
+        sheet.write_row(2, 1, ['System', 'Workbook Generated', 'Consolidated workbook created from parsed documents'])
         
         sheet.set_column('A:A', 20)
         sheet.set_column('B:B', 20)
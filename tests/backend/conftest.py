@@ -7,6 +7,15 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../app/backend'))
 
 
+@pytest.fixture(scope="session")
+def client():
+    """FastAPI test client shared across the test session."""
+    from fastapi.testclient import TestClient
+    from main import app
+
+    return TestClient(app)
+
+
 @pytest.fixture
 def sample_financial_data():
     """Sample financial data for testing."""
@@ -26,3 +35,51 @@ def sample_financial_data():
         ]
     }
 
+
+
+@pytest.fixture
+def db_session():
+    """SQLite session with every table created, discarded after the test."""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import StaticPool
+    from database import Base
+    import models  # noqa: F401 - registers the tables on Base
+
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+@pytest.fixture
+def engagement_user(db_session):
+    """A user and an engagement in the same tenant."""
+    from models import Tenant, User, Engagement
+
+    tenant = Tenant(name="Test Tenant", slug="test-tenant")
+    db_session.add(tenant)
+    db_session.flush()
+
+    user = User(
+        tenant_id=tenant.id,
+        email="analyst@example.com",
+        hashed_password="not-a-real-hash",
+        full_name="Test Analyst"
+    )
+    db_session.add(user)
+    db_session.flush()
+
+    engagement = Engagement(tenant_id=tenant.id, name="Test Engagement", created_by=user.id)
+    db_session.add(engagement)
+    db_session.commit()
+
+    return user, engagement
@@ -1,33 +1,34 @@
 """Basic API tests."""
+import asyncio
+from datetime import datetime, timezone
+from types import SimpleNamespace
 import pytest
-from fastapi.testclient import TestClient
-from main import app
 
-client = TestClient(app)
+from models import Engagement, JobStatus, ValidationIssue, ValidationSeverity, ValuationRun
 
 
-def test_health_check():
+def test_health_check(client):
     """Test health endpoint."""
     response = client.get("/health")
     assert response.status_code == 200
     assert response.json()["status"] == "healthy"
 
 
-def test_root_endpoint():
+def test_root_endpoint(client):
     """Test root endpoint."""
     response = client.get("/")
     assert response.status_code == 200
     assert "service" in response.json()
 
 
-def test_readiness_check():
+def test_readiness_check(client):
     """Test readiness endpoint."""
     response = client.get("/ready")
     assert response.status_code == 200
     assert response.json()["status"] == "ready"
 
 
-def test_register_user():
+def test_register_user(client):
     """Test user registration."""
     response = client.post("/api/v1/auth/register", json={
         "email": "test@example.com",
@@ -39,7 +40,7 @@ def test_register_user():
     assert response.status_code in [200, 201, 400]
 
 
-def test_login_invalid_credentials():
+def test_login_invalid_credentials(client):
     """Test login with invalid credentials."""
     response = client.post("/api/v1/auth/login", json={
         "email": "nonexistent@example.com",
@@ -47,3 +48,180 @@ def test_login_invalid_credentials():
     })
     assert response.status_code == 401
 
+
+
+class _RecordingTasksClient:
+    """Cloud Tasks stand-in that records the tasks it is asked to create."""
+
+    def __init__(self, *args, **kwargs):
+        self.tasks = []
+
+    def queue_path(self, project, location, queue):
+        return f"projects/{project}/locations/{location}/queues/{queue}"
+
+    def create_task(self, request):
+        self.tasks.append(request["task"])
+        return request["task"]
+
+
+@pytest.fixture
+def api_v1(monkeypatch):
+    """The v1 endpoint modules, importable without GCP credentials."""
+    from google.cloud import pubsub_v1, storage, tasks_v2
+
+    # The endpoint modules create their GCP clients at import time
+    monkeypatch.setattr(storage, "Client", lambda *args, **kwargs: None)
+    monkeypatch.setattr(pubsub_v1, "PublisherClient", lambda *args, **kwargs: None)
+    monkeypatch.setattr(tasks_v2, "CloudTasksClient", _RecordingTasksClient)
+
+    from api.v1 import validation, valuation
+
+    monkeypatch.setattr(valuation, "tasks_client", _RecordingTasksClient())
+    return SimpleNamespace(validation=validation, valuation=valuation)
+
+
+def test_validation_issue_counts(api_v1, db_session, engagement_user):
+    """Test validation counts are derived from the listed issues."""
+    user, engagement = engagement_user
+    other = Engagement(tenant_id=user.tenant_id, name="Other Engagement")
+    db_session.add(other)
+    db_session.flush()
+
+    severities = [
+        ValidationSeverity.ERROR, ValidationSeverity.WARNING, ValidationSeverity.ERROR,
+        ValidationSeverity.INFO, ValidationSeverity.WARNING, ValidationSeverity.ERROR
+    ]
+    for n, severity in enumerate(severities):
+        db_session.add(ValidationIssue(
+            engagement_id=engagement.id,
+            severity=severity,
+            description=f"Issue {n}",
+            is_resolved=n < 2
+        ))
+    # Issues on another engagement are not counted
+    db_session.add(ValidationIssue(
+        engagement_id=other.id, severity=ValidationSeverity.ERROR, description="Elsewhere"
+    ))
+    db_session.commit()
+
+    result = asyncio.run(api_v1.validation.list_validation_issues(
+        engagement.id, current_user=user, db=db_session
+    ))
+
+    assert result["total"] == 6
+    assert (result["errors"], result["warnings"], result["info"]) == (3, 2, 1)
+    assert result["unresolved"] == 4
+    assert [issue.severity for issue in result["issues"]] == sorted(severities, key=lambda s: s.name)
+
+
+def _request(headers=None):
+    """Bare GET request carrying the given headers."""
+    from starlette.requests import Request
+
+    raw_headers = [(name.lower().encode(), value.encode()) for name, value in (headers or {}).items()]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": raw_headers})
+
+
+def test_valuation_result_etag(api_v1, db_session, engagement_user):
+    """Test completed results carry an ETag and revalidate with 304 Not Modified."""
+    from fastapi import Response
+
+    user, engagement = engagement_user
+    completed = ValuationRun(
+        engagement_id=engagement.id,
+        run_number=1,
+        valuation_date=datetime(2024, 12, 31),
+        methods_config={},
+        assumptions={},
+        status=JobStatus.COMPLETED,
+        results_detail={"dcf": {"enterprise_value": 100.0}}
+    )
+    pending = ValuationRun(
+        engagement_id=engagement.id,
+        run_number=2,
+        valuation_date=datetime(2024, 12, 31),
+        methods_config={},
+        assumptions={},
+        status=JobStatus.PENDING
+    )
+    db_session.add_all([completed, pending])
+    db_session.commit()
+    get_result = api_v1.valuation.get_valuation_result
+
+    response = Response()
+    result = asyncio.run(get_result(engagement.id, _request(), response, current_user=user, db=db_session))
+
+    etag = f'"valuation-run-{completed.id}"'
+    assert response.headers["etag"] == etag
+    assert response.headers["cache-control"] == "private, no-cache"
+    assert result["run"].id == completed.id
+    assert result["dcf_details"] == {"enterprise_value": 100.0}
+
+    # A matching If-None-Match gets an empty 304 with the same validators
+    not_modified = asyncio.run(get_result(
+        engagement.id, _request({"If-None-Match": etag}), Response(), current_user=user, db=db_session
+    ))
+    assert not_modified.status_code == 304
+    assert not_modified.body == b""
+    assert not_modified.headers["etag"] == etag
+
+    # A stale validator gets the full result
+    response = Response()
+    result = asyncio.run(get_result(
+        engagement.id, _request({"If-None-Match": '"valuation-run-0"'}), response,
+        current_user=user, db=db_session
+    ))
+    assert result["run"].id == completed.id
+    assert response.headers["etag"] == etag
+
+    # Runs that can still change are never cached
+    response = Response()
+    result = asyncio.run(get_result(
+        engagement.id, _request({"If-None-Match": etag}), response,
+        run_id=pending.id, current_user=user, db=db_session
+    ))
+    assert result["run"].id == pending.id
+    assert "etag" not in response.headers
+
+
+def test_run_valuation_idempotent_replay(api_v1, db_session, engagement_user):
+    """Test a retried run request with the same Idempotency-Key returns the first run."""
+    from schemas.valuation import ValuationRunRequest
+
+    user, engagement = engagement_user
+    request = ValuationRunRequest(
+        valuation_date=datetime(2024, 12, 31, tzinfo=timezone.utc),
+        wacc_inputs={
+            "risk_free_rate": 0.045,
+            "equity_risk_premium": 0.06,
+            "beta": 1.1,
+            "cost_of_debt": 0.07,
+            "tax_rate": 0.25,
+            "debt_weight": 0.3,
+            "equity_weight": 0.7
+        },
+        methods={"dcf": {"terminal_growth_rate": 0.025}}
+    )
+    run_valuation = api_v1.valuation.run_valuation
+    tasks = api_v1.valuation.tasks_client.tasks
+
+    first = asyncio.run(run_valuation(
+        engagement.id, request, idempotency_key="retry-1", current_user=user, db=db_session
+    ))
+    replay = asyncio.run(run_valuation(
+        engagement.id, request, idempotency_key="retry-1", current_user=user, db=db_session
+    ))
+
+    assert replay.id == first.id
+    assert first.idempotency_key == "retry-1"
+    assert first.valuation_date == datetime(2024, 12, 31)
+    assert len(tasks) == 1
+    assert db_session.query(ValuationRun).count() == 1
+
+    # A new key is a new request, even with the same body
+    second = asyncio.run(run_valuation(
+        engagement.id, request, idempotency_key="retry-2", current_user=user, db=db_session
+    ))
+    assert second.id != first.id
+    assert second.run_number == 2
+    assert len(tasks) == 2
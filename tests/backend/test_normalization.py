@@ -0,0 +1,43 @@
+"""Normalization tests."""
+import pandas as pd
+import pytest
+from normalization.normalizer import FinancialNormalizer
+
+
+@pytest.fixture
+def normalizer():
+    """Normalizer over a small balance sheet chart of accounts."""
+    coa = pd.DataFrame([
+        {'code': 'ASSET_CURR_001', 'label': 'Cash'},
+        {'code': 'ASSET_CURR_004', 'label': 'Inventory'},
+        {'code': 'LIAB_CURR_001', 'label': 'Accounts Payable'},
+        {'code': 'EQUITY_001', 'label': 'Common Stock'},
+        {'code': 'EQUITY_002', 'label': 'Retained Earnings'}
+    ])
+    return FinancialNormalizer(coa)
+
+
+def test_balance_sheet_reconciliation(normalizer):
+    """Test the balance sheet equation is checked per period across all classified items."""
+    mapped_data = [
+        {'canonical_code': 'ASSET_CURR_001', 'values': {'2022': 100, '2023': 150}},
+        {'canonical_code': 'ASSET_CURR_004', 'values': {'2022': 50, '2023': 60}},
+        {'canonical_code': 'LIAB_CURR_001', 'values': {'2022': 70, '2023': 80}},
+        {'canonical_code': 'EQUITY_001', 'values': {'2022': 30, '2023': 30}},
+        {'canonical_code': 'EQUITY_002', 'values': {'2022': 50, '2023': 90.5}},
+        # Unmapped rows are ignored
+        {'canonical_code': 'OTHER_001', 'values': {'2022': 999, '2023': 999}}
+    ]
+    
+    result = normalizer.normalize_balance_sheet(mapped_data, ['2022', '2023'])
+    
+    # 2022 balances (150 = 70 + 80); 2023 assets of 210 exceed 80 + 120.5
+    assert result['reconciliation'] == [{
+        'period': '2023',
+        'rule': 'balance_sheet_equation',
+        'description': 'Balance sheet out of balance in 2023',
+        'total_assets': 210.0,
+        'total_liabilities': 80.0,
+        'total_equity': 120.5,
+        'difference': 9.5
+    }]
@@ -0,0 +1,72 @@
+"""Excel parser tests."""
+import pandas as pd
+from openpyxl import Workbook, load_workbook
+from parsers.excel_parser import ExcelParser
+
+
+def _write_workbook(path):
+    """Write a sheet with numeric year headers above numeric data."""
+    wb = Workbook()
+    ws = wb.active
+    ws.title = 'IS'
+    ws.append(['Line item', 'Notes', 2022, 2023])
+    ws.append(['Revenue', 'a', 100.5, 200])
+    ws.append(['COGS', 'b', 40, 80.25])
+    wb.save(path)
+
+
+def test_parse_sheet_numeric_year_headers(tmp_path):
+    """Test year headers over numeric columns keep their year labels."""
+    path = tmp_path / 'statements.xlsx'
+    _write_workbook(path)
+    # Parsing helpers don't touch GCS, so skip the storage client
+    parser = ExcelParser.__new__(ExcelParser)
+    
+    with pd.ExcelFile(path, engine='openpyxl') as excel_file:
+        sheet = parser._parse_sheet(excel_file, 'IS')
+    
+    assert sheet['columns'] == ['Line item', 'Notes', '2022', '2023']
+    assert sheet['numeric_columns'] == ['2022', '2023']
+    assert sheet['data'][0] == {'Line item': 'Revenue', 'Notes': 'a', '2022': 100.5, '2023': 200.0}
+    
+    # The streaming reader builds its header from the same rows
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        streamed = parser._parse_streamed_sheet(wb['IS'])
+    finally:
+        wb.close()
+    
+    assert streamed['columns'] == sheet['columns']
+    assert streamed['data'] == sheet['data']
+
+
+def test_parse_sheet_keeps_na_header_labels(tmp_path):
+    """Test NA-marker header labels stay literal and NA markers don't leak into dtypes."""
+    path = tmp_path / 'markers.xlsx'
+    wb = Workbook()
+    ws = wb.active
+    ws.title = 'IS'
+    ws.append(['Prepared by', None, 'NA'])
+    ws.append(['Line item', 'Notes', 'NA'])
+    ws.append(['Revenue', 'a', 1])
+    ws.append(['COGS', 'b', 2])
+    wb.save(path)
+    parser = ExcelParser.__new__(ExcelParser)
+    
+    with pd.ExcelFile(path, engine='openpyxl') as excel_file:
+        sheet = parser._parse_sheet(excel_file, 'IS')
+    
+    assert sheet['header_row'] == 1
+    assert sheet['columns'] == ['Line item', 'Notes', 'NA']
+    # The 'NA' above the header must not turn the int column into float
+    assert sheet['numeric_columns'] == ['NA']
+    assert [row['NA'] for row in sheet['data']] == [1, 2]
+    assert isinstance(sheet['data'][0]['NA'], int)
+    
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        streamed = parser._parse_streamed_sheet(wb['IS'])
+    finally:
+        wb.close()
+    
+    assert streamed['columns'] == sheet['columns']
@@ -0,0 +1,79 @@
+"""Validation rule tests."""
+from validation.rules import ValidationRules
+
+
+def test_issue_templates_build_independent_issues():
+    """Test issues built from shared templates carry their fields and own their lists."""
+    rules = ValidationRules()
+    data = {
+        'line_items': [
+            {'code': 'REV_001', 'values': {'2022': -10, '2023': -20}},
+            {'code': 'COGS_001', 'values': {'2022': 5, '2023': 5}},
+            {'code': 'NI_001', 'values': {'2022': 1, '2023': 1}}
+        ]
+    }
+    
+    issues = rules.validate_income_statement(data)
+    
+    assert issues == [
+        {
+            'rule_code': 'NEG_REVENUE',
+            'severity': 'error',
+            'affected_items': ['REV_001'],
+            'description': 'Negative revenue detected in 2022',
+            'period': '2022',
+            'value': -10.0
+        },
+        {
+            'rule_code': 'NEG_REVENUE',
+            'severity': 'error',
+            'affected_items': ['REV_001'],
+            'description': 'Negative revenue detected in 2023',
+            'period': '2023',
+            'value': -20.0
+        }
+    ]
+    
+    # Editing one issue must not leak into other issues or later runs
+    issues[0]['affected_items'].append('GP_001')
+    issues[0]['severity'] = 'warning'
+    assert issues[1]['affected_items'] == ['REV_001']
+    
+    rerun = rules.validate_income_statement(data)
+    assert rerun[0]['affected_items'] == ['REV_001']
+    assert rerun[0]['severity'] == 'error'
+
+
+def test_reconciliation_checks_single_pass():
+    """Test reconciliation failures are routed to balance sheet and cash flow issues."""
+    rules = ValidationRules()
+    data = {
+        'line_items': [],
+        'reconciliation': [
+            {'rule': 'balance_sheet_equation', 'period': '2022', 'description': 'BS off in 2022', 'difference': 10.0},
+            {'rule': 'Cash_Rollforward', 'period': '2022', 'description': 'Cash off in 2022'},
+            {'rule': 'BALANCE_SHEET_EQUATION', 'period': '2023', 'description': 'Not the BS rule', 'difference': 1.0},
+            {'rule': 'balance_sheet_equation', 'period': '2023', 'description': 'BS off in 2023', 'difference': -5.0}
+        ]
+    }
+    
+    bs_issues = [i for i in rules.validate_balance_sheet(data) if i['rule_code'] != 'MISSING_CRITICAL_ITEM']
+    cf_issues = [i for i in rules.validate_cash_flow(data) if i['rule_code'] != 'MISSING_CRITICAL_ITEM']
+    
+    # The balance sheet rule name is matched exactly
+    assert [(i['rule_code'], i['period'], i['difference']) for i in bs_issues] == [
+        ('BS_IMBALANCE', '2022', 10.0),
+        ('BS_IMBALANCE', '2023', -5.0)
+    ]
+    # Cash rules match on a case-insensitive substring
+    assert cf_issues == [{
+        'rule_code': 'CF_RECON_FAIL',
+        'severity': 'error',
+        'affected_items': ['CF_*'],
+        'description': 'Cash off in 2022',
+        'period': '2022'
+    }]
+    
+    # Statements without reconciliation entries only get the other checks
+    no_recon = rules.validate_balance_sheet({'line_items': []})
+    assert {issue['rule_code'] for issue in no_recon} == {'MISSING_CRITICAL_ITEM'}
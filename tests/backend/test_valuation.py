@@ -1,8 +1,11 @@
 """Valuation engine tests."""
+from decimal import Decimal
 import pytest
-from valuation.wacc import WACCCalculator
+import numpy as np
+from valuation.wacc import WACCAssumptions, WACCCalculator
 from valuation.dcf import DCFValuation
 from valuation.gpcm import GPCMValuation
+from valuation.gtm import GTMValuation
 
 
 def test_wacc_calculation():
@@ -27,6 +30,60 @@ def test_wacc_calculation():
     assert 'cost_of_equity' in result
     assert result['wacc'] > 0
     assert result['wacc'] < 1
+    
+    assumptions = WACCAssumptions.from_dict(inputs)
+    assert calculator.calculate_wacc(assumptions) == result
+    
+    # Decimal and numeric-string inputs are accepted, as with Decimal(str(x))
+    assert calculator.calculate_levered_beta(Decimal('1.0'), '0.5', 0.25) == pytest.approx(1.375)
+    assert calculator.calculate_unlevered_beta('1.375', Decimal('0.5'), '0.25') == pytest.approx(1.0)
+
+
+def test_wacc_batch_matches_scalar():
+    """Test batched WACC over a beta x ERP grid."""
+    calculator = WACCCalculator()
+    
+    betas = np.array([0.8, 1.0, 1.2])
+    erps = np.array([0.05, 0.06])
+    beta_axis, erp_axis = np.ix_(betas, erps)
+    
+    result = calculator.calculate_wacc_batch(
+        risk_free_rate=0.045,
+        equity_risk_premium=erp_axis,
+        beta=beta_axis,
+        cost_of_debt=0.06,
+        tax_rate=0.25,
+        debt_weight=0.3,
+        equity_weight=0.7,
+        size_premium=0.02
+    )
+    
+    assert result['wacc'].shape == (3, 2)
+    scalar = calculator.calculate_wacc({
+        'risk_free_rate': 0.045,
+        'equity_risk_premium': 0.06,
+        'beta': 1.2,
+        'size_premium': 0.02,
+        'cost_of_debt': 0.06,
+        'tax_rate': 0.25,
+        'debt_weight': 0.3,
+        'equity_weight': 0.7
+    })
+    assert result['wacc'][2, 1] == pytest.approx(scalar['wacc'])
+    
+    grid = calculator.calculate_wacc_grid(
+        {
+            'risk_free_rate': 0.045,
+            'size_premium': 0.02,
+            'cost_of_debt': 0.06,
+            'tax_rate': 0.25,
+            'debt_weight': 0.3,
+            'equity_weight': 0.7
+        },
+        betas=betas,
+        equity_risk_premiums=erps
+    )
+    np.testing.assert_allclose(grid['wacc'], result['wacc'])
 
 
 def test_dcf_calculation():
@@ -55,6 +112,57 @@ def test_dcf_calculation():
     assert result['enterprise_value'] > 0
 
 
+def test_dcf_sensitivity_analysis():
+    """Test DCF sensitivity grid against single-point DCF runs."""
+    dcf = DCFValuation()
+    
+    historical = {
+        'cash': 1000000,
+        'total_debt': 500000
+    }
+    fcf = [100000, 110000, 120000, 130000, 140000]
+    
+    result = dcf.sensitivity_analysis(
+        base_fcf=fcf,
+        base_wacc=0.10,
+        base_growth=0.025,
+        wacc_range=[0.08, 0.10, 0.03],
+        growth_range=[0.02, 0.03],
+        historical_financials=historical
+    )
+    
+    table = result['sensitivity_table']
+    assert len(table) == 3 and all(len(row) == 2 for row in table)
+    
+    expected = dcf.calculate_dcf(
+        historical_financials=historical,
+        forecast={'free_cash_flow': fcf},
+        wacc=0.10,
+        terminal_growth_rate=0.02
+    )
+    assert table[1][0] == pytest.approx(expected['equity_value'])
+    
+    # WACC <= growth is not a valid combination
+    assert table[2][1] is None
+    
+    growths = [g / 1000 for g in range(0, 100, 5)]
+    breakeven = dcf.breakeven_growth(
+        base_fcf=fcf,
+        target_equity=3000000,
+        wacc_range=[0.08, 0.10, 0.20],
+        growth_range=growths,
+        historical_financials=historical
+    )
+    
+    grid = dcf.sensitivity_analysis(fcf, 0.10, 0.025, [0.08, 0.10, 0.20], growths, historical)
+    expected_breakeven = [
+        next((g for g, v in zip(growths, row) if v is not None and v >= 3000000), None)
+        for row in grid['sensitivity_table']
+    ]
+    assert breakeven['breakeven_growth'] == expected_breakeven
+    assert expected_breakeven[-1] is None
+
+
 def test_gpcm_calculation():
     """Test GPCM valuation."""
     gpcm = GPCMValuation()
@@ -94,4 +202,75 @@ def test_gpcm_calculation():
     
     assert 'concluded_value' in result
     assert result['concluded_value'] > 0
+    
+    ev_revenue = result['valuations_by_multiple']['EV/Revenue']
+    assert ev_revenue['indicated_value_median'] == pytest.approx(25000000)
+    assert ev_revenue['adjusted_value_median'] == pytest.approx(18750000)
+
+
+def test_gpcm_adjust_for_differences():
+    """Test compounding of GPCM adjustments."""
+    gpcm = GPCMValuation()
+    
+    result = gpcm.adjust_for_differences(
+        base_value=1000.0,
+        adjustments={'size': -0.10, 'growth': 0.05}
+    )
+    
+    assert result['adjustments'][0]['amount'] == pytest.approx(-100.0)
+    assert result['adjustments'][1]['amount'] == pytest.approx(45.0)
+    assert result['adjusted_value'] == pytest.approx(945.0)
+
 
+def test_gtm_calculation():
+    """Test GTM valuation."""
+    gtm = GTMValuation()
+    
+    subject = {
+        'revenue': 5000000,
+        'ebitda': 1000000
+    }
+    
+    transactions = [
+        {
+            'target_name': 'Target A',
+            'acquirer_name': 'Buyer A',
+            'metrics': {
+                'enterprise_value': 40000000,
+                'revenue': 10000000,
+                'ebitda': 2000000
+            }
+        },
+        {
+            'target_name': 'Target B',
+            'acquirer_name': 'Buyer B',
+            'metrics': {
+                'transaction_value': 30000000,
+                'ltm_revenue': 10000000,
+                'ebitda': 0
+            }
+        }
+    ]
+    
+    result = gtm.calculate_gtm(
+        subject_metrics=subject,
+        comparable_transactions=transactions,
+        multiples_to_use=['EV/Revenue', 'EV/EBITDA']
+    )
+    
+    ev_revenue = result['valuations_by_multiple']['EV/Revenue']
+    assert ev_revenue['transaction_multiples'] == [4.0, 3.0]
+    assert ev_revenue['indicated_value_median'] == pytest.approx(17500000)
+    # Transaction B has no positive EBITDA and is excluded
+    assert result['valuations_by_multiple']['EV/EBITDA']['transaction_multiples'] == [20.0]
+    assert result['comparable_transactions'][1] == {
+        'target_name': 'Target B',
+        'acquirer_name': 'Buyer B',
+        'date': None,
+        'metrics': transactions[1]['metrics']
+    }
+    assert result['concluded_value'] > 0
+    
+    table, _ = gtm.multiple_results(subject, transactions, ['EV/Revenue', 'EV/EBITDA'])
+    assert table['type'].tolist() == ['EV/Revenue', 'EV/EBITDA']
+    assert table['iv_median'][0] == pytest.approx(17500000)
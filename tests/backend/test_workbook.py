@@ -0,0 +1,61 @@
+"""Workbook generator tests."""
+import xlsxwriter
+from openpyxl import load_workbook
+from workbook import generator
+from workbook.generator import WorkbookGenerator
+
+
+def _normalized_data(n_items):
+    """Normalized statements with n_items income statement line items over three periods."""
+    periods = ['2021', '2022', '2023']
+    line_items = [
+        {'label': f'Line {n}', 'values': {'2021': n, '2022': n * 1.5, '2023': n * 2}}
+        for n in range(n_items)
+    ]
+    return {
+        'income_statement': {'periods': periods, 'line_items': line_items},
+        'balance_sheet': {'periods': periods, 'line_items': line_items[:2]},
+        'cash_flow': {}
+    }
+
+
+def _sheet_values(buffer):
+    """Every sheet's cell values, keyed by sheet name."""
+    wb = load_workbook(buffer)
+    return {ws.title: [list(row) for row in ws.iter_rows(values_only=True)] for ws in wb.worksheets}
+
+
+def test_large_workbook_uses_constant_memory(monkeypatch):
+    """Test large statements switch to constant_memory without changing the output."""
+    options_used = []
+    workbook_class = xlsxwriter.Workbook
+    
+    def recording_workbook(filename, options=None):
+        options_used.append(options)
+        return workbook_class(filename, options)
+    
+    monkeypatch.setattr(generator.xlsxwriter, 'Workbook', recording_workbook)
+    monkeypatch.setattr(generator, '_CONSTANT_MEMORY_MIN_ROWS', 10)
+    engagement_data = {'name': 'Test Engagement', 'client_name': 'Client'}
+    workbook_generator = WorkbookGenerator()
+    
+    small = workbook_generator.build_consolidated_workbook(engagement_data, _normalized_data(5))
+    large = workbook_generator.build_consolidated_workbook(engagement_data, _normalized_data(8))
+    
+    # 5 + 2 line items stay in memory; 8 + 2 reach the threshold
+    assert options_used == [{'in_memory': True}, {'constant_memory': True}]
+    
+    # Same content either way, so build the large data in memory as the reference
+    monkeypatch.setattr(generator, '_CONSTANT_MEMORY_MIN_ROWS', 1000)
+    reference = workbook_generator.build_consolidated_workbook(engagement_data, _normalized_data(8))
+    
+    assert options_used[-1] == {'in_memory': True}
+    assert large.tell() == 0
+    large_values = _sheet_values(large)
+    reference_values = _sheet_values(reference)
+    # Cover and Audit Log stamp the generation time, so compare the statement sheets
+    for sheet in ('Income Statement', 'Balance Sheet', 'Cash Flow'):
+        assert large_values[sheet] == reference_values[sheet]
+    assert large_values['Income Statement'][1] == ['Line 0', 0, 0, 0]
+    assert large_values['Income Statement'][8] == ['Line 7', 7, 10.5, 14]
+    assert len(_sheet_values(small)['Income Statement']) == 7